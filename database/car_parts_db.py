@@ -311,20 +311,206 @@ class CarPartsDB:
                 self.logger.error(f"Database error updating part #{part_id}: {e}")
                 return False
 
+    # Columns that update_parts may write to
+    UPDATABLE_COLUMNS = ('category', 'car_name', 'model', 'product_name', 'quantity',
+                         'price')
+
+    # Each row of a CASE update binds three parameters; stay under SQLite's
+    # 999 parameter limit on older builds
+    UPDATE_BATCH_SIZE = 300
+
+    def update_parts(self, updates):
+        """Apply many single-field updates in one transaction
+
+        Args:
+            updates: Dict mapping (part_id, field) to the new value
+
+        Returns:
+            int: Number of rows updated, or -1 on error
+        """
+        if not updates:
+            return 0
+
+        # Group by field so each field is written with one statement per batch
+        by_field = {}
+        for (part_id, field), value in updates.items():
+            if field not in self.UPDATABLE_COLUMNS:
+                self.logger.error(f"Cannot update unknown column '{field}'")
+                return -1
+            by_field.setdefault(field, []).append((part_id, value))
+
+        with self.lock:
+            self.ensure_connection()
+            try:
+                self.local.conn.execute("BEGIN TRANSACTION")
+                updated = 0
+                for field, rows in by_field.items():
+                    for i in range(0, len(rows), self.UPDATE_BATCH_SIZE):
+                        batch = rows[i:i + self.UPDATE_BATCH_SIZE]
+                        # UPDATE ... SET field = CASE id WHEN ? THEN ? ... END
+                        # WHERE id IN (...), so each batch is a single statement
+                        cases = ' '.join(['WHEN ? THEN ?'] * len(batch))
+                        placeholders = ','.join(['?'] * len(batch))
+                        params = [param for row in batch for param in row]
+                        params.extend(part_id for part_id, value in batch)
+                        self.local.cursor.execute(f"""
+                            UPDATE parts
+                            SET {field} = CASE id {cases} END,
+                                last_updated = CURRENT_TIMESTAMP
+                            WHERE id IN ({placeholders})
+                        """, params)
+                        updated += self.local.cursor.rowcount
+                self.local.conn.commit()
+
+                thread_id = threading.get_ident()
+                self.logger.info(
+                    f"Thread {thread_id}: Applied {len(updates)} field updates to parts")
+                return updated
+            except sqlite3.Error as e:
+                self.logger.error(f"Database error in batch update: {e}")
+                try:
+                    self.local.conn.rollback()
+                except:
+                    pass
+                return -1
+
     def delete_part(self, part_id):
-        """Delete a part by ID"""
+        """Delete a part by ID
+
+        If called inside a transaction opened with begin_transaction(), the
+        delete is left for the caller to commit instead of committing per row.
+        """
         with self.lock:
             self.ensure_connection()
             try:
                 thread_id = threading.get_ident()
                 self.logger.info(f"Thread {thread_id}: Deleting part {part_id}")
+                in_outer_transaction = self.local.conn.in_transaction
                 self.local.cursor.execute("DELETE FROM parts WHERE id = ?", (part_id,))
-                self.local.conn.commit()
+                if not in_outer_transaction:
+                    self.local.conn.commit()
                 return self.local.cursor.rowcount > 0
             except sqlite3.Error as e:
                 self.logger.error(f"Database error: {str(e)}")
                 return False
 
+    # Older SQLite builds allow at most 999 bound parameters per statement
+    DELETE_BATCH_SIZE = 500
+
+    def delete_parts(self, part_ids):
+        """Delete parts by ID with one DELETE ... IN statement per batch
+
+        If called inside a transaction opened with begin_transaction(), the
+        deletes are left for the caller to commit (or roll back on error).
+
+        Returns:
+            list: IDs of the parts that existed and were deleted, or None on error
+        """
+        if not part_ids:
+            return []
+
+        with self.lock:
+            self.ensure_connection()
+            in_outer_transaction = self.local.conn.in_transaction
+            try:
+                if not in_outer_transaction:
+                    self.local.conn.execute("BEGIN TRANSACTION")
+
+                deleted_ids = []
+                for i in range(0, len(part_ids), self.DELETE_BATCH_SIZE):
+                    batch = part_ids[i:i + self.DELETE_BATCH_SIZE]
+                    placeholders = ','.join(['?'] * len(batch))
+
+                    # Note which IDs exist so callers learn exactly what was removed
+                    self.local.cursor.execute(
+                        f"SELECT id FROM parts WHERE id IN ({placeholders})", batch)
+                    deleted_ids.extend(row[0] for row in self.local.cursor.fetchall())
+
+                    self.local.cursor.execute(
+                        f"DELETE FROM parts WHERE id IN ({placeholders})", batch)
+
+                if not in_outer_transaction:
+                    self.local.conn.commit()
+
+                self.logger.debug("Thread %d: Deleted %d parts", threading.get_ident(),
+                                  len(deleted_ids))
+                return deleted_ids
+            except sqlite3.Error as e:
+                self.logger.error(f"Database error in bulk delete: {e}")
+                if not in_outer_transaction:
+                    try:
+                        self.local.conn.rollback()
+                    except:
+                        pass
+                return None
+
+    def delete_parts_chunked(self, part_ids, chunk_size=1000, on_chunk=None,
+                             should_stop=None, commit_size=None):
+        """Delete parts by ID in chunks, committing once per commit_size IDs
+
+        Each chunk is deleted with bulk statements and reported to on_chunk.
+        Committing per commit_size keeps each write lock short on large
+        deletions, while smaller deletions finish in a single transaction.
+        A chunk that fails rolls back its uncommitted group and ends the
+        deletion; groups committed before it stay deleted.
+
+        Args:
+            part_ids: IDs of the parts to delete
+            chunk_size: Number of IDs deleted between progress reports
+            on_chunk: Optional callable receiving the number of IDs processed
+                so far after each chunk
+            should_stop: Optional callable; when it returns True no further
+                chunks are deleted and the chunks already deleted are committed
+            commit_size: Number of IDs per transaction; defaults to chunk_size
+
+        Returns:
+            list: IDs of the parts that were deleted
+        """
+        commit_size = commit_size or chunk_size
+        deleted_ids = []
+        pending_ids = []
+        in_transaction = False
+        group_start = 0
+        for start in range(0, len(part_ids), chunk_size):
+            if should_stop is not None and should_stop():
+                self.logger.info("Chunked deletion stopped by caller")
+                break
+
+            if not in_transaction:
+                in_transaction = self.begin_transaction()
+                group_start = start
+
+            chunk = part_ids[start:start + chunk_size]
+            chunk_deleted = self.delete_parts(chunk)
+            if chunk_deleted is None:
+                if in_transaction:
+                    self.rollback_transaction()
+                pending_ids = []
+                in_transaction = False
+                break
+            pending_ids.extend(chunk_deleted)
+
+            processed = start + len(chunk)
+            if in_transaction and (processed - group_start >= commit_size
+                                   or processed == len(part_ids)):
+                if not self.commit_transaction():
+                    pending_ids = []
+                    in_transaction = False
+                    break
+                in_transaction = False
+            if not in_transaction:
+                deleted_ids.extend(pending_ids)
+                pending_ids = []
+
+            if on_chunk is not None:
+                on_chunk(processed)
+
+        if in_transaction:
+            # Stopped early: keep what was deleted before the stop
+            if self.commit_transaction():
+                deleted_ids.extend(pending_ids)
+        return deleted_ids
+
     def delete_multiple_parts(self, part_ids):
         """Delete multiple parts in a single transaction"""
         if not part_ids:
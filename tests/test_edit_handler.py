@@ -0,0 +1,40 @@
+import pytest
+
+from widgets.products.components.product_model import ProductsTableModel
+from widgets.products.product_widget.core.product_manager import ProductManager
+from widgets.products.product_widget.handlers.edit_handler import EditHandler
+
+QUANTITY = 5
+
+
+class Translator:
+    def t(self, key):
+        return key
+
+
+def make_handler():
+    manager = ProductManager(db=None)
+    manager.set_products([(1, "Brakes", "BMW", "X5", "Pads", 3, 2.0, None)])
+    model = ProductsTableModel()
+    model.set_products(manager.get_products())
+    return EditHandler(Translator(), db=None), model, manager
+
+
+@pytest.mark.parametrize("text", ["--5", "²", "abc"])
+def test_invalid_quantity_resets_the_cell_to_zero(text):
+    handler, model, manager = make_handler()
+    model.set_value(0, QUANTITY, text)
+
+    success, part_id, field, value, _ = handler.handle_cell_change(0, QUANTITY, model, manager)
+
+    assert (success, part_id, field, value) == (True, 1, "quantity", 0)
+    assert model.value(0, QUANTITY) == 0
+
+
+def test_quantity_is_parsed_as_int():
+    handler, model, manager = make_handler()
+    model.set_value(0, QUANTITY, " -7 ")
+
+    success, _, _, value, _ = handler.handle_cell_change(0, QUANTITY, model, manager)
+
+    assert success and value == -7
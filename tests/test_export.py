@@ -0,0 +1,41 @@
+import csv
+
+from widgets.products.components.product_model import ProductsTableModel
+from widgets.products.product_widget.core.product import Product
+from widgets.products.utils import export_to_csv
+
+HEADERS = ["ID", "Category", "Car", "Model", "Name", "Quantity", "Price"]
+
+
+def read_rows(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.reader(f))
+
+
+def test_row_texts_formats_products_like_the_table():
+    model = ProductsTableModel()
+    model.set_products([Product(7, "Brakes", None, "", "Pad, front", 3, 12.5)])
+
+    rows = list(model.row_texts(model.products()))
+
+    assert rows == [["7", "Brakes", "-", "-", "Pad, front", "3", "12.50"]]
+    assert rows[0] == [model.text(0, col) for col in range(model.COLUMN_COUNT)]
+
+
+def test_export_writes_every_product_row(tmp_path):
+    products = [Product(i, "Engine", "BMW", "X5", f"Part {i}", i, i * 1.5)
+                for i in range(1, 2501)]
+    model = ProductsTableModel()
+    model.set_products(products)
+    path = tmp_path / "parts.CSV"
+
+    written = []
+    success = export_to_csv(str(path), HEADERS, model.row_texts(model.products()),
+                            progress_callback=written.append, progress_interval=1000)
+
+    assert success
+    rows = read_rows(path)
+    assert rows[0] == HEADERS
+    assert len(rows) == 1 + len(products)
+    assert rows[-1] == ["2500", "Engine", "BMW", "X5", "Part 2500", "2500", "3750.00"]
+    assert written == [1000, 2000, 2500]
@@ -0,0 +1,42 @@
+from widgets.products.components.product_model import ProductsTableModel
+from widgets.products.product_widget.core.product import Product
+
+
+def make_product(pid=1, name="Brake pad"):
+    return Product(pid, "Brakes", "BMW", "X5", name, 4, 12.5, "2025-01-01")
+
+
+def test_positional_reads_match_fields():
+    product = make_product()
+    assert product[0] == 1
+    assert product[4] == "Brake pad"
+    assert product[-1] == "2025-01-01"
+    assert tuple(product) == (1, "Brakes", "BMW", "X5", "Brake pad", 4, 12.5,
+                              "2025-01-01")
+
+
+def test_slices_return_tuples():
+    product = make_product()
+    assert product[:3] == (1, "Brakes", "BMW")
+    assert product[5:7] == (4, 12.5)
+
+
+def test_copy_is_independent():
+    product = make_product()
+    copy = product.copy()
+    copy[4] = "Disc"
+    assert product.product_name == "Brake pad"
+    assert copy.product_name == "Disc"
+
+
+def test_set_value_keeps_product_rows_and_leaves_source_unchanged():
+    product = make_product()
+    model = ProductsTableModel()
+    model.set_products([product])
+
+    model.set_value(0, ProductsTableModel.QUANTITY_COLUMN, 9)
+
+    row = model.product_at(0)
+    assert isinstance(row, Product)
+    assert row.quantity == 9
+    assert product.quantity == 4
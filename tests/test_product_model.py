@@ -0,0 +1,54 @@
+from widgets.products.components.product_model import ProductsTableModel
+from widgets.products.product_widget.core.product import Product
+from widgets.products.product_widget.core.product_manager import ProductManager
+
+
+def make_rows(ids):
+    return [(pid, "Brakes", "BMW", "X5", f"Part {pid}", 1, 2.0, None) for pid in ids]
+
+
+def test_add_then_refresh_inserts_through_the_model():
+    manager = ProductManager(db=None)
+    manager.set_products(make_rows([1, 2]))
+    model = ProductsTableModel()
+    model.set_products(manager.get_products())
+    inserted = []
+    model.rowsInserted.connect(lambda parent, first, last: inserted.append((first, last)))
+
+    # The manager appends to its own list; the model must not see it yet
+    product = manager.upsert_product(make_rows([3])[0])
+    assert model.rowCount() == 2
+    assert model.find_row(3) == -1
+
+    assert model.upsert_product(product) == 0
+    assert inserted == [(0, 0)]
+    assert model.rowCount() == 3
+    assert len(manager.get_products()) == 3
+
+
+def test_remove_ids_notifies_once_per_run_of_adjacent_rows():
+    model = ProductsTableModel()
+    model.set_products([Product.from_row(row) for row in make_rows(range(10))])
+    removed = []
+    model.rowsRemoved.connect(lambda parent, first, last: removed.append((first, last)))
+
+    assert model.remove_ids([1, 2, 3, 7, 8, 42]) == 5
+
+    assert removed == [(7, 8), (1, 3)]
+    assert [model.product_id(row) for row in range(model.rowCount())] == [0, 4, 5, 6, 9]
+
+
+def test_remove_ids_resets_when_rows_are_scattered():
+    count = 2 * (ProductsTableModel.REMOVE_RESET_RUNS + 1)
+    model = ProductsTableModel()
+    model.set_products([Product.from_row(row) for row in make_rows(range(count))])
+    resets = []
+    removed = []
+    model.modelReset.connect(lambda: resets.append(True))
+    model.rowsRemoved.connect(lambda parent, first, last: removed.append((first, last)))
+
+    assert model.remove_ids(range(0, count, 2)) == count // 2
+
+    assert resets == [True]
+    assert removed == []
+    assert all(model.product_id(row) % 2 for row in range(model.rowCount()))
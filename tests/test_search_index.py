@@ -0,0 +1,38 @@
+import pytest
+
+pytest.importorskip("numpy")
+
+from widgets.products.product_widget.core import scan_kernel, search_index
+from widgets.products.product_widget.core.product import Product
+from widgets.products.product_widget.core.search_index import SearchIndex
+
+
+def make_index(count):
+    return SearchIndex([Product(i, "Brakes", "BMW", "X5", f"Part {i}", 1, 2.0)
+                        for i in range(count)])
+
+
+def test_failed_numba_scan_falls_back_to_string_scan(monkeypatch):
+    def broken_scan(blob, offsets, needle):
+        raise RuntimeError("numba compile failed")
+
+    monkeypatch.setattr(scan_kernel, "HAVE_NUMBA", True)
+    monkeypatch.setattr(scan_kernel, "scan_rows", broken_scan)
+    index = make_index(search_index.NUMBA_SCAN_THRESHOLD)
+
+    assert index.find_all("part 49999") == [49999]
+    assert scan_kernel.HAVE_NUMBA is False
+    # Later searches go straight to the string scan
+    assert index.find_all("part 4999") == [4999] + list(range(49990, 50000))
+
+
+def test_numba_scan_is_skipped_below_its_threshold(monkeypatch):
+    def unexpected_scan(blob, offsets, needle):
+        raise AssertionError("Numba scan used below its threshold")
+
+    monkeypatch.setattr(scan_kernel, "HAVE_NUMBA", True)
+    monkeypatch.setattr(scan_kernel, "scan_rows", unexpected_scan)
+    index = make_index(search_index.BLOB_SCAN_THRESHOLD)
+
+    assert index.find_all("part 4999") == [4999]
+    assert scan_kernel.HAVE_NUMBA is True
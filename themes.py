@@ -98,6 +98,11 @@ def set_theme(theme_name):
     _current_theme = theme_name if theme_name in THEMES else "classic"
 
 
+def get_current_theme():
+    """Return the name of the active theme"""
+    return _current_theme
+
+
 # Add this to your themes.py file
 
 def apply_enhanced_borders():
@@ -167,7 +172,9 @@ def get_color(color_key):
     if isinstance(color_key, tuple) or len(color_key) > 30:
         print("Invalid get_color call:")
         traceback.print_stack()
-    return THEMES[_current_theme].get(color_key, QColor(0, 0, 0))
+    color = THEMES[_current_theme].get(color_key)
+    # Only build the black fallback when the key is actually missing
+    return color if color is not None else QColor(0, 0, 0)
 
 
 def apply_dialog_theme(dialog, title="", icon_path=None, min_width=400):
@@ -103,6 +103,10 @@ TRANSLATIONS = {
         'en': 'Deleting {count} items...',
         'he': 'מוחק {count} פריטים...'
     },
+    'exporting_items': {
+        'en': 'Exporting {count} items...',
+        'he': 'מייצא {count} פריטים...'
+    },
     'add_error': {
         'en': 'Error adding product',
         'he': 'שגיאה בהוספת מוצר'
@@ -520,18 +524,25 @@ TRANSLATIONS = {
 
 class Translator:
     def __init__(self, language='en'):
-        self.language = language
+        self.set_language(language)
 
     def t(self, key):
-        translation = TRANSLATIONS.get(key, {}).get(self.language)
+        translation = self._strings.get(key)
         if translation is None:
-            print(
-                f"Warning: Missing translation for key '{key}' in language '{self.language}'")
+            # Warn once per key rather than on every lookup
+            if key not in self._missing:
+                self._missing.add(key)
+                print(
+                    f"Warning: Missing translation for key '{key}' in language '{self.language}'")
             return key
         return translation
 
     def set_language(self, language):
         self.language = language
+        # Resolve every string for this language once, so t() is one lookup
+        self._strings = {key: values[language] for key, values in TRANSLATIONS.items()
+                         if language in values}
+        self._missing = set()
 
 
 if __name__ == '__main__':
@@ -1,22 +1,49 @@
-from PyQt5.QtCore import Qt, pyqtSignal, QTimer, QPoint, QEvent
+from PyQt5.QtCore import Qt, pyqtSignal, QTimer, QRectF, QSize, QEvent
 from PyQt5.QtWidgets import (QWidget, QLineEdit, QHBoxLayout, QPushButton,
                              QCompleter, QListView, QFrame, QShortcut,
-                             QAbstractItemView, QStyledItemDelegate)
+                             QAbstractItemView, QStyle, QStyledItemDelegate)
 from PyQt5.QtGui import QFont, QColor, QKeySequence, QPainter, QPen, QBrush, QPainterPath
 from typing import List, Optional
 
-from themes import get_color
+from themes import get_color, get_current_theme
+
+# Translation keys of the suggestions shown when the database has none
+_SUGGESTION_KEYS = (
+    "suggestion_parts",
+    "suggestion_service",
+    "suggestion_repair",
+    "suggestion_brands",
+    "suggestion_inventory"
+)
+
+# Used if the suggestions can't be loaded or translated at all
+_DEFAULT_SUGGESTIONS = ("Parts", "Service", "Repair", "Brands", "Inventory")
+
+# Quiet time after the last keystroke before suggestions are filtered
+COMPLETION_DELAY_MS = 120
+
+# Shorter queries match too much to be useful, so no suggestions are shown
+MIN_COMPLETION_LENGTH = 2
 
 
 class SuggestionDelegate(QStyledItemDelegate):
     """Custom delegate for styling suggestion items in the completer popup"""
 
+    # Paint colors derived per theme name, shared by all instances
+    _palette_cache = {}
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.hover_index = -1
 
-    def paint(self, painter, option, index):
-        """Override paint method to provide custom styling for each suggestion item"""
+    @classmethod
+    def _palette(cls):
+        """Get the (text, accent, hover, is_dark) colors for the current theme"""
+        theme_name = get_current_theme()
+        palette = cls._palette_cache.get(theme_name)
+        if palette is not None:
+            return palette
+
         # Get colors from parent theme if available
         try:
             bg_color = get_color('background')
@@ -30,22 +57,31 @@ class SuggestionDelegate(QStyledItemDelegate):
             hover_bg.setAlpha(70)  # Semi-transparent hover effect
         except:
             # Fallback colors
-            bg_color = "#ffffff" if option.state & QAbstractItemView.State_Selected else "#f5f5f5"
             text_color = "#333333"
             accent_color = "#4a90e2"
             hover_bg = QColor(accent_color)
             hover_bg.setAlpha(70)
             is_dark = False
 
+        palette = (QColor(text_color), QColor(accent_color), hover_bg, is_dark)
+        cls._palette_cache[theme_name] = palette
+        return palette
+
+    def paint(self, painter, option, index):
+        """Override paint method to provide custom styling for each suggestion item"""
+        # Every visible item is repainted as the filter changes, so the theme
+        # colors are only worked out once per theme
+        text_color, accent_color, hover_bg, is_dark = self._palette()
+
         # Selected item styling
-        if option.state & QAbstractItemView.State_Selected:
+        if option.state & QStyle.State_Selected:
             painter.save()
             painter.setPen(Qt.NoPen)
-            painter.setBrush(QColor(accent_color))
+            painter.setBrush(accent_color)
 
             # Draw rounded rectangle for selection
             path = QPainterPath()
-            path.addRoundedRect(option.rect.adjusted(4, 2, -4, -2), 6, 6)
+            path.addRoundedRect(QRectF(option.rect.adjusted(4, 2, -4, -2)), 6, 6)
             painter.drawPath(path)
 
             # Draw text in white or contrasting color
@@ -66,11 +102,11 @@ class SuggestionDelegate(QStyledItemDelegate):
 
             # Draw rounded rectangle for hover
             path = QPainterPath()
-            path.addRoundedRect(option.rect.adjusted(4, 2, -4, -2), 6, 6)
+            path.addRoundedRect(QRectF(option.rect.adjusted(4, 2, -4, -2)), 6, 6)
             painter.drawPath(path)
 
             # Draw text
-            painter.setPen(QPen(QColor(text_color), 1))
+            painter.setPen(QPen(text_color, 1))
             painter.drawText(option.rect.adjusted(15, 0, -10, 0), Qt.AlignVCenter,
                              index.data())
             painter.restore()
@@ -78,7 +114,7 @@ class SuggestionDelegate(QStyledItemDelegate):
         # Normal item styling
         else:
             painter.save()
-            painter.setPen(QPen(QColor(text_color), 1))
+            painter.setPen(QPen(text_color, 1))
             painter.drawText(option.rect.adjusted(15, 0, -10, 0), Qt.AlignVCenter,
                              index.data())
             painter.restore()
@@ -86,12 +122,15 @@ class SuggestionDelegate(QStyledItemDelegate):
     def sizeHint(self, option, index):
         """Adjust the size of suggestion items for better spacing"""
         size = super().sizeHint(option, index)
-        return QPoint(size.width(), size.height() + 10)  # Add vertical padding
+        return QSize(size.width(), size.height() + 10)  # Add vertical padding
 
 
 class ModernCompleterPopup(QListView):
     """Enhanced list view for search suggestions with elegant visuals"""
 
+    # Stylesheets built per theme name, shared by all instances
+    _style_cache = {}
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setObjectName("suggestionsPopup")
@@ -107,6 +146,32 @@ class ModernCompleterPopup(QListView):
         self.delegate = SuggestionDelegate(self)
         self.setItemDelegate(self.delegate)
 
+        # Theme whose stylesheet is applied, so reapplying it is skipped
+        self._applied_theme = None
+
+    def apply_styles(self):
+        """Apply themed styling to the popup, once per theme change"""
+        theme_name = get_current_theme()
+        if theme_name == self._applied_theme:
+            return
+
+        try:
+            style = ModernCompleterPopup._style_cache.get(theme_name)
+            if style is None:
+                style = ModernSearchWidget._build_popup_style()
+                ModernCompleterPopup._style_cache[theme_name] = style
+            self.setStyleSheet(style)
+            self._applied_theme = theme_name
+        except Exception as e:
+            print(f"Error styling suggestions popup: {str(e)}")
+
+    def showEvent(self, event):
+        """Style the popup for the current theme as it opens"""
+        # Popups that are never shown, or are hidden across a theme change,
+        # don't pay for a stylesheet they wouldn't use
+        self.apply_styles()
+        super().showEvent(event)
+
     def mouseMoveEvent(self, event):
         """Track mouse position for hover effects"""
         index = self.indexAt(event.pos())
@@ -133,6 +198,9 @@ class ModernSearchWidget(QWidget):
     """
     search_submitted = pyqtSignal(str)
 
+    # Stylesheets built per theme name, shared by all instances
+    _style_cache = {}
+
     def __init__(self, translator, database, parent=None):
         """
         Initialize the search widget with translator and database.
@@ -149,6 +217,9 @@ class ModernSearchWidget(QWidget):
         # Configuration - always visible at fixed width
         self.default_width = 350  # Increased default width
 
+        # Theme whose stylesheet is applied, so reapplying it is skipped
+        self._applied_theme = None
+
         # Setup components
         self._setup_ui()
         self._setup_shortcuts()
@@ -191,6 +262,12 @@ class ModernSearchWidget(QWidget):
         self.search_edit.setPlaceholderText(self._translate("search_placeholder"))
         self.search_edit.textChanged.connect(self._on_text_changed)
 
+        # Completion runs once typing pauses, not on every keystroke
+        self._completion_timer = QTimer(self)
+        self._completion_timer.setSingleShot(True)
+        self._completion_timer.setInterval(COMPLETION_DELAY_MS)
+        self._completion_timer.timeout.connect(self._update_completion)
+
         # Search submit button (enter key icon)
         self.search_button = QPushButton("⏎")
         self.search_button.setObjectName("searchSubmitButton")
@@ -232,6 +309,10 @@ class ModernSearchWidget(QWidget):
         if not suggestions:
             return
 
+        self._create_completer(suggestions)
+
+    def _create_completer(self, suggestions: List[str]) -> None:
+        """Create the completer and its popup for the search input."""
         # Create and configure completer
         self.completer = QCompleter(suggestions)
         self.completer.setCaseSensitivity(Qt.CaseInsensitive)
@@ -241,15 +322,15 @@ class ModernSearchWidget(QWidget):
         # Create custom popup for suggestions
         popup = ModernCompleterPopup()  # Use the enhanced popup class
         popup.setMinimumWidth(300)  # Ensure popup is wide enough for suggestions
-
-        # Style the popup scrollbar to match theme
         self.completer.setPopup(popup)
 
-        # Set completer for search input
-        self.search_edit.setCompleter(self.completer)
+        # Attached with setWidget() rather than setCompleter(), so the line
+        # edit doesn't re-filter on every keystroke; _update_completion
+        # filters once typing pauses
+        self.completer.setWidget(self.search_edit)
 
         # Connect completer activated signal
-        self.completer.activated.connect(self.submit_search)
+        self.completer.activated.connect(self._on_suggestion_activated)
 
     def _get_search_suggestions(self) -> List[str]:
         """
@@ -266,17 +347,11 @@ class ModernSearchWidget(QWidget):
                     return db_suggestions
 
             # Fall back to translated static suggestions
-            return [
-                self._translate("suggestion_parts"),
-                self._translate("suggestion_service"),
-                self._translate("suggestion_repair"),
-                self._translate("suggestion_brands"),
-                self._translate("suggestion_inventory")
-            ]
+            return [self._translate(key) for key in _SUGGESTION_KEYS]
         except Exception as e:
             # Log error instead of silently failing
             print(f"Error loading search suggestions: {str(e)}")
-            return ["Parts", "Service", "Repair", "Brands", "Inventory"]
+            return list(_DEFAULT_SUGGESTIONS)
 
     def _translate(self, key: str, default: str = "") -> str:
         """
@@ -303,8 +378,30 @@ class ModernSearchWidget(QWidget):
         Args:
             text: Current text in the search field
         """
-        # For future enhancements - real-time search behavior
-        pass
+        # Restart the wait, so a burst of keystrokes is completed only once
+        self._completion_timer.start()
+
+    def _update_completion(self) -> None:
+        """Show the suggestions matching the text once typing has paused."""
+        completer = getattr(self, 'completer', None)
+        if completer is None:
+            return
+
+        text = self.search_edit.text()
+        if len(text.strip()) < MIN_COMPLETION_LENGTH:
+            completer.popup().hide()
+            return
+
+        completer.setCompletionPrefix(text)
+        if completer.completionCount():
+            completer.complete()
+        else:
+            completer.popup().hide()
+
+    def _on_suggestion_activated(self, suggestion: str) -> None:
+        """Search for a suggestion picked from the popup."""
+        self.search_edit.setText(suggestion)
+        self.submit_search()
 
     def submit_search(self) -> None:
         """Submit the current search query."""
@@ -323,8 +420,8 @@ class ModernSearchWidget(QWidget):
 
     def _reset_button_style(self) -> None:
         """Reset button style after visual feedback."""
+        # The widget's own stylesheet still applies to the button
         self.search_button.setStyleSheet("")
-        self.apply_theme()
 
     def clear_search(self) -> None:
         """Clear search input."""
@@ -340,203 +437,26 @@ class ModernSearchWidget(QWidget):
         # Refresh suggestions if needed
         if hasattr(self, 'completer'):
             self.completer.setModel(None)  # Clear old model
-            self.completer = QCompleter(self._get_search_suggestions())
-            self.completer.setCaseSensitivity(Qt.CaseInsensitive)
-            self.completer.setFilterMode(Qt.MatchContains)
-
-            # Preserve popup settings
-            popup = ModernCompleterPopup()
-            popup.setMinimumWidth(300)
-            self.completer.setPopup(popup)
-
-            self.search_edit.setCompleter(self.completer)
+            self._create_completer(self._get_search_suggestions())
 
     def apply_theme(self) -> None:
-        """Apply theme styling to all components."""
-        try:
-            # Get colors from theme system
-            bg_color = get_color('header')
-            text_color = get_color('text')
-            card_bg = get_color('card_bg', get_color('background'))
-
-            # Try to get accent color, fall back to a default if not available
-            try:
-                accent_color = get_color('accent')
-            except:
-                # Create a lighter/darker variation of border color as fallback
-                border_color = get_color('border')
-                border_qcolor = QColor(border_color)
-                bg_qcolor = QColor(bg_color)
-                is_dark = bg_qcolor.lightness() < 128
-
-                if is_dark:
-                    accent_color = border_qcolor.lighter(150).name()
-                else:
-                    accent_color = border_qcolor.darker(150).name()
-
-            # Get QColor object for luminance calculations
-            bg = QColor(bg_color)
-            is_dark = bg.lightness() < 128
-
-            # Create color variations based on theme brightness
-            if is_dark:
-                container_bg = "rgba(255, 255, 255, 0.12)"
-                button_bg = "rgba(255, 255, 255, 0.15)"
-                button_hover = "rgba(255, 255, 255, 0.25)"
-                selection_bg = accent_color
-                focus_border = accent_color
-                popup_bg = QColor(card_bg).darker(110).name()
-                shadow_color = "rgba(0, 0, 0, 0.7)"
-            else:
-                container_bg = "rgba(0, 0, 0, 0.05)"
-                button_bg = "rgba(0, 0, 0, 0.08)"
-                button_hover = "rgba(0, 0, 0, 0.15)"
-                selection_bg = accent_color
-                focus_border = accent_color
-                popup_bg = QColor(card_bg).lighter(103).name()
-                shadow_color = "rgba(0, 0, 0, 0.2)"
-
-            # Apply unified styling with focus states and transitions
-            self.setStyleSheet(f"""
-                #searchContainer {{
-                    background-color: {container_bg};
-                    border-radius: 18px;
-                    border: none;
-                }}
-
-                #searchInput {{
-                    background-color: transparent;
-                    color: {text_color};
-                    border: none;
-                    padding: 0px 5px;
-                    margin: 0px 5px;
-                    font-size: 10pt;
-                    selection-background-color: {selection_bg};
-                    selection-color: white;
-                }}
-
-                #searchInput:focus {{
-                    border: none;
-                    outline: none;
-                }}
-
-                #searchContainer:focus-within {{
-                    border: 1px solid {focus_border};
-                }}
-
-                #searchIcon {{
-                    background-color: transparent;
-                    color: {text_color};
-                    border: none;
-                    padding: 0px;
-                    font-size: 14px;
-                    min-width: 28px;
-                    min-height: 28px;
-                }}
-
-                #searchSubmitButton {{
-                    background-color: {button_bg};
-                    color: {text_color};
-                    border-radius: 14px;
-                    border: none;
-                    padding: 0px;
-                    font-size: 14px;
-                    min-width: 28px;
-                    min-height: 28px;
-                    transition: background-color 0.2s;
-                }}
-
-                #searchSubmitButton:hover {{
-                    background-color: {button_hover};
-                }}
-
-                #searchSubmitButton:pressed {{
-                    background-color: {accent_color};
-                    color: white;
-                }}
-
-                /* Enhanced suggestion popup styling */
-                #suggestionsPopup {{
-                    background-color: {popup_bg};
-                    border: 1px solid {focus_border};
-                    border-radius: 12px;
-                    padding: 8px 4px;
-                    margin-top: 2px;
-                    font-size: 11pt;
-                }}
-
-                /* Scrollbar styling for suggestions popup */
-                #suggestionsPopup QScrollBar:vertical {{
-                    background: transparent;
-                    width: 6px;
-                    margin: 4px 2px;
-                    border-radius: 3px;
-                }}
-
-                #suggestionsPopup QScrollBar::handle:vertical {{
-                    background: {focus_border};
-                    border-radius: 3px;
-                    min-height: 20px;
-                }}
-
-                #suggestionsPopup QScrollBar::handle:vertical:hover {{
-                    background: {accent_color};
-                }}
-
-                #suggestionsPopup QScrollBar::add-line:vertical,
-                #suggestionsPopup QScrollBar::sub-line:vertical {{
-                    height: 0px;
-                }}
-
-                #suggestionsPopup QScrollBar::add-page:vertical,
-                #suggestionsPopup QScrollBar::sub-page:vertical {{
-                    background: transparent;
-                }}
-            """)
+        """Apply theme styling to all components, once per theme change."""
+        theme_name = get_current_theme()
+        if theme_name == self._applied_theme:
+            return
 
-            # Style the completer popup if it exists
-            if hasattr(self, 'completer') and self.completer:
-                popup = self.completer.popup()
-                if popup:
-                    # Apply a drop shadow effect to the popup
-                    popup.setStyleSheet(f"""
-                        #suggestionsPopup {{
-                            background-color: {popup_bg};
-                            border: 1px solid {focus_border};
-                            border-radius: 12px;
-                            padding: 8px 4px;
-                            margin-top: 2px;
-                            font-size: 11pt;
-                        }}
-
-                        /* Scrollbar styling for suggestions popup */
-                        QScrollBar:vertical {{
-                            background: transparent;
-                            width: 6px;
-                            margin: 4px 2px;
-                            border-radius: 3px;
-                        }}
-
-                        QScrollBar::handle:vertical {{
-                            background: {focus_border};
-                            border-radius: 3px;
-                            min-height: 20px;
-                        }}
-
-                        QScrollBar::handle:vertical:hover {{
-                            background: {accent_color};
-                        }}
-
-                        QScrollBar::add-line:vertical,
-                        QScrollBar::sub-line:vertical {{
-                            height: 0px;
-                        }}
-
-                        QScrollBar::add-page:vertical,
-                        QScrollBar::sub-page:vertical {{
-                            background: transparent;
-                        }}
-                    """)
+        try:
+            style = ModernSearchWidget._style_cache.get(theme_name)
+            if style is None:
+                style = self._build_style()
+                ModernSearchWidget._style_cache[theme_name] = style
+            self.setStyleSheet(style)
+            self._applied_theme = theme_name
+
+            # A hidden popup restyles itself when next shown
+            completer = getattr(self, 'completer', None)
+            if completer is not None and completer.popup().isVisible():
+                completer.popup().apply_styles()
 
         except Exception as e:
             print(f"Error applying theme: {str(e)}")
@@ -572,6 +492,203 @@ class ModernSearchWidget(QWidget):
                 }
             """)
 
+    @staticmethod
+    def _theme_colors() -> dict:
+        """Get the colors the search stylesheets are built from."""
+        # Get colors from theme system
+        bg_color = get_color('header')
+        text_color = get_color('text')
+        card_bg = get_color('card_bg')
+
+        # Try to get accent color, fall back to a default if not available
+        try:
+            accent_color = get_color('accent')
+        except:
+            # Create a lighter/darker variation of border color as fallback
+            border_color = get_color('border')
+            border_qcolor = QColor(border_color)
+            bg_qcolor = QColor(bg_color)
+            is_dark = bg_qcolor.lightness() < 128
+
+            if is_dark:
+                accent_color = border_qcolor.lighter(150).name()
+            else:
+                accent_color = border_qcolor.darker(150).name()
+
+        # Get QColor object for luminance calculations
+        bg = QColor(bg_color)
+        is_dark = bg.lightness() < 128
+
+        # Create color variations based on theme brightness
+        if is_dark:
+            container_bg = "rgba(255, 255, 255, 0.12)"
+            button_bg = "rgba(255, 255, 255, 0.15)"
+            button_hover = "rgba(255, 255, 255, 0.25)"
+            selection_bg = accent_color
+            focus_border = accent_color
+            popup_bg = QColor(card_bg).darker(110).name()
+        else:
+            container_bg = "rgba(0, 0, 0, 0.05)"
+            button_bg = "rgba(0, 0, 0, 0.08)"
+            button_hover = "rgba(0, 0, 0, 0.15)"
+            selection_bg = accent_color
+            focus_border = accent_color
+            popup_bg = QColor(card_bg).lighter(103).name()
+
+        return {
+            'text_color': text_color,
+            'accent_color': accent_color,
+            'container_bg': container_bg,
+            'button_bg': button_bg,
+            'button_hover': button_hover,
+            'selection_bg': selection_bg,
+            'focus_border': focus_border,
+            'popup_bg': popup_bg,
+        }
+
+    @classmethod
+    def _build_style(cls) -> str:
+        """Build the widget stylesheet from the current theme colors."""
+        colors = cls._theme_colors()
+        return f"""
+            #searchContainer {{
+                background-color: {colors['container_bg']};
+                border-radius: 18px;
+                border: none;
+            }}
+
+            #searchInput {{
+                background-color: transparent;
+                color: {colors['text_color']};
+                border: none;
+                padding: 0px 5px;
+                margin: 0px 5px;
+                font-size: 10pt;
+                selection-background-color: {colors['selection_bg']};
+                selection-color: white;
+            }}
+
+            #searchInput:focus {{
+                border: none;
+                outline: none;
+            }}
+
+            #searchContainer:focus-within {{
+                border: 1px solid {colors['focus_border']};
+            }}
+
+            #searchIcon {{
+                background-color: transparent;
+                color: {colors['text_color']};
+                border: none;
+                padding: 0px;
+                font-size: 14px;
+                min-width: 28px;
+                min-height: 28px;
+            }}
+
+            #searchSubmitButton {{
+                background-color: {colors['button_bg']};
+                color: {colors['text_color']};
+                border-radius: 14px;
+                border: none;
+                padding: 0px;
+                font-size: 14px;
+                min-width: 28px;
+                min-height: 28px;
+            }}
+
+            #searchSubmitButton:hover {{
+                background-color: {colors['button_hover']};
+            }}
+
+            #searchSubmitButton:pressed {{
+                background-color: {colors['accent_color']};
+                color: white;
+            }}
+
+            /* Enhanced suggestion popup styling */
+            #suggestionsPopup {{
+                background-color: {colors['popup_bg']};
+                border: 1px solid {colors['focus_border']};
+                border-radius: 12px;
+                padding: 8px 4px;
+                margin-top: 2px;
+                font-size: 11pt;
+            }}
+
+            /* Scrollbar styling for suggestions popup */
+            #suggestionsPopup QScrollBar:vertical {{
+                background: transparent;
+                width: 6px;
+                margin: 4px 2px;
+                border-radius: 3px;
+            }}
+
+            #suggestionsPopup QScrollBar::handle:vertical {{
+                background: {colors['focus_border']};
+                border-radius: 3px;
+                min-height: 20px;
+            }}
+
+            #suggestionsPopup QScrollBar::handle:vertical:hover {{
+                background: {colors['accent_color']};
+            }}
+
+            #suggestionsPopup QScrollBar::add-line:vertical,
+            #suggestionsPopup QScrollBar::sub-line:vertical {{
+                height: 0px;
+            }}
+
+            #suggestionsPopup QScrollBar::add-page:vertical,
+            #suggestionsPopup QScrollBar::sub-page:vertical {{
+                background: transparent;
+            }}
+        """
+
+    @classmethod
+    def _build_popup_style(cls) -> str:
+        """Build the suggestions popup stylesheet from the current theme colors."""
+        colors = cls._theme_colors()
+        return f"""
+            #suggestionsPopup {{
+                background-color: {colors['popup_bg']};
+                border: 1px solid {colors['focus_border']};
+                border-radius: 12px;
+                padding: 8px 4px;
+                margin-top: 2px;
+                font-size: 11pt;
+            }}
+
+            /* Scrollbar styling for suggestions popup */
+            QScrollBar:vertical {{
+                background: transparent;
+                width: 6px;
+                margin: 4px 2px;
+                border-radius: 3px;
+            }}
+
+            QScrollBar::handle:vertical {{
+                background: {colors['focus_border']};
+                border-radius: 3px;
+                min-height: 20px;
+            }}
+
+            QScrollBar::handle:vertical:hover {{
+                background: {colors['accent_color']};
+            }}
+
+            QScrollBar::add-line:vertical,
+            QScrollBar::sub-line:vertical {{
+                height: 0px;
+            }}
+
+            QScrollBar::add-page:vertical,
+            QScrollBar::sub-page:vertical {{
+                background: transparent;
+            }}
+        """
+
 
 # Primary alias for backward compatibility
 class SearchWidget(ModernSearchWidget):
@@ -1,3 +1,4 @@
 # Export component classes
 from .status_bar import StatusBar
-from .table_delegates import ThemedNumericDelegate
\ No newline at end of file
+from .table_delegates import ThemedNumericDelegate
+from .product_model import ProductsTableModel
\ No newline at end of file
@@ -0,0 +1,295 @@
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, pyqtSignal
+from PyQt5.QtGui import QColor
+from themes import get_color
+from widgets.products.product_widget.core.product import FIELD_GETTERS
+
+
+class ProductsTableModel(QAbstractTableModel):
+    """Table model exposing product tuples to a QTableView
+
+    Rows are the product tuples themselves; cell text is produced on demand
+    in data(), so replacing the product list is O(1) and the view only
+    formats the rows it actually paints.
+    """
+
+    # Emitted after the user edits a cell through the view
+    cellEdited = pyqtSignal(int, int)  # Row, column
+
+    COLUMN_COUNT = 7
+    ID_COLUMN = 0
+    NAME_COLUMN = 4
+    QUANTITY_COLUMN = 5
+    PRICE_COLUMN = 6
+
+    # Above this many separate runs of removed rows, remove_ids resets the model
+    REMOVE_RESET_RUNS = 32
+
+    _ALIGNMENTS = (
+        Qt.AlignCenter,  # ID
+        Qt.AlignLeft | Qt.AlignVCenter,  # Category
+        Qt.AlignLeft | Qt.AlignVCenter,  # Car
+        Qt.AlignLeft | Qt.AlignVCenter,  # Model
+        Qt.AlignLeft | Qt.AlignVCenter,  # Product name
+        Qt.AlignCenter,  # Quantity
+        Qt.AlignRight | Qt.AlignVCenter  # Price
+    )
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._headers = [""] * self.COLUMN_COUNT
+        self._highlighted_id = None
+        self._highlight_colors = (None, None)  # Background, foreground
+
+    # --- Qt model interface ---
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.COLUMN_COUNT
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row, col = index.row(), index.column()
+        if role == Qt.DisplayRole or role == Qt.EditRole:
+            return self.text(row, col)
+        if role == Qt.TextAlignmentRole:
+            return int(self._ALIGNMENTS[col])
+        if self._highlighted_id is not None and self._rows[row][0] == self._highlighted_id:
+            if role == Qt.BackgroundRole:
+                return self._highlight_colors[0]
+            if role == Qt.ForegroundRole:
+                return self._highlight_colors[1]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if (orientation == Qt.Horizontal and role == Qt.DisplayRole
+                and 0 <= section < self.COLUMN_COUNT):
+            return self._headers[section]
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        flags = Qt.ItemIsSelectable | Qt.ItemIsEnabled
+        if index.column() != self.ID_COLUMN:
+            flags |= Qt.ItemIsEditable
+        return flags
+
+    def setData(self, index, value, role=Qt.EditRole):
+        """Store a value edited through the view and announce the edit"""
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+
+        row, col = index.row(), index.column()
+        if value == self.text(row, col):
+            # Nothing changed, same as QTableWidgetItem which emits no change
+            return True
+
+        self.set_value(row, col, value)
+        self.cellEdited.emit(row, col)
+        return True
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """Sort rows by a column, numerically for the ID, quantity and price"""
+        if not self._rows:
+            return
+
+        numeric = column in (self.ID_COLUMN, self.QUANTITY_COLUMN, self.PRICE_COLUMN)
+        get_value = FIELD_GETTERS[column]
+        rows = self._rows
+
+        def sort_key(position):
+            value = get_value(rows[position])
+            if numeric:
+                try:
+                    return float(value or 0)
+                except (TypeError, ValueError):
+                    return 0.0
+            return str(value or "").lower()
+
+        self.layoutAboutToBeChanged.emit()
+        permutation = sorted(range(len(self._rows)), key=sort_key,
+                             reverse=order == Qt.DescendingOrder)
+        self._rows = [self._rows[i] for i in permutation]
+
+        # Keep selections and other persistent indexes on the same products
+        new_positions = {old: new for new, old in enumerate(permutation)}
+        old_indexes = self.persistentIndexList()
+        new_indexes = [self.index(new_positions[index.row()], index.column())
+                       for index in old_indexes]
+        self.changePersistentIndexList(old_indexes, new_indexes)
+        self.layoutChanged.emit()
+
+    # --- Product helpers ---
+
+    def set_headers(self, headers):
+        """Set the horizontal header labels"""
+        self._headers = list(headers)
+        self.headerDataChanged.emit(Qt.Horizontal, 0, self.COLUMN_COUNT - 1)
+
+    def set_products(self, products):
+        """Replace all rows with the given products
+
+        The list is copied, so later changes to the caller's list (such as
+        ProductManager appending a new product) only reach the view through
+        this model's insert and remove notifications.
+        """
+        self.beginResetModel()
+        self._rows = list(products)
+        self._highlighted_id = None
+        self.endResetModel()
+
+    def product_at(self, row):
+        """Get the product shown in a row"""
+        return self._rows[row]
+
+    def product_id(self, row):
+        """Get the ID of the product shown in a row"""
+        return self._rows[row].id
+
+    def value(self, row, col):
+        """Get the raw value stored in a cell"""
+        return FIELD_GETTERS[col](self._rows[row])
+
+    def text(self, row, col):
+        """Get the display text for a cell"""
+        value = FIELD_GETTERS[col](self._rows[row])
+        if col == self.PRICE_COLUMN:
+            try:
+                return f"{float(value):.2f}"
+            except (TypeError, ValueError):
+                return str(value)
+        if col == self.ID_COLUMN or col == self.QUANTITY_COLUMN:
+            return str(value)
+        return str(value) if value not in [None, ""] else "-"
+
+    def products(self):
+        """Get a copy of the list of shown products, in view order"""
+        return list(self._rows)
+
+    @classmethod
+    def row_texts(cls, products):
+        """Yield the display text of each product's row
+
+        Gives the same text as text() for each cell, but unpacks each product
+        once per row rather than once per cell, for exports that need them all.
+        Only reads the given products, so it can run on a worker thread.
+        """
+        for product in products:
+            try:
+                price_text = f"{float(product.price):.2f}"
+            except (TypeError, ValueError):
+                price_text = str(product.price)
+            category = product.category
+            car = product.car_name
+            model = product.model
+            name = product.product_name
+            yield [str(product.id),
+                   str(category) if category not in [None, ""] else "-",
+                   str(car) if car not in [None, ""] else "-",
+                   str(model) if model not in [None, ""] else "-",
+                   str(name) if name not in [None, ""] else "-",
+                   str(product.quantity),
+                   price_text]
+
+    def set_value(self, row, col, value):
+        """Replace a cell value without announcing it as a user edit
+
+        The row gets its own copy of the product, so the in-memory product it
+        was shown from keeps its value until the edit is saved.
+        """
+        product = self._rows[row].copy()
+        product[col] = value
+        self._rows[row] = product
+        index = self.index(row, col)
+        self.dataChanged.emit(index, index)
+
+    def find_row(self, product_id):
+        """Get the row showing a product ID, or -1 if it is not shown"""
+        for row, product in enumerate(self._rows):
+            if product.id == product_id:
+                return row
+        return -1
+
+    def upsert_product(self, product):
+        """Show a product, refreshing its row or inserting it at the top
+
+        Returns:
+            int: Row showing the product
+        """
+        row = self.find_row(product.id)
+        if row >= 0:
+            self._rows[row] = product
+            self.dataChanged.emit(self.index(row, 0),
+                                  self.index(row, self.COLUMN_COUNT - 1))
+            return row
+
+        self.beginInsertRows(QModelIndex(), 0, 0)
+        self._rows.insert(0, product)
+        self.endInsertRows()
+        return 0
+
+    def remove_ids(self, product_ids):
+        """Remove the rows of the given product IDs
+
+        Adjacent rows are removed together, with one notification per run
+        of rows. Past REMOVE_RESET_RUNS runs the model is reset instead,
+        since the view relayouts once per notification.
+
+        Returns:
+            int: Number of rows removed
+        """
+        ids = set(product_ids)
+        doomed = [row for row, product in enumerate(self._rows) if product.id in ids]
+        if not doomed:
+            return 0
+
+        # Group the rows into (first, last) runs of adjacent rows
+        runs = []
+        first = last = doomed[0]
+        for row in doomed[1:]:
+            if row != last + 1:
+                runs.append((first, last))
+                first = row
+            last = row
+        runs.append((first, last))
+
+        if len(runs) > self.REMOVE_RESET_RUNS:
+            self.beginResetModel()
+            self._rows = [product for product in self._rows if product.id not in ids]
+            self.endResetModel()
+            return len(doomed)
+
+        # Last run first, so removing a run doesn't shift the ones still to go
+        for first, last in reversed(runs):
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self._rows[first:last + 1]
+            self.endRemoveRows()
+        return len(doomed)
+
+    def set_highlighted_id(self, product_id, row=None):
+        """Highlight the row of a product ID, clearing any previous highlight
+
+        Pass row when the caller already knows which row shows the product.
+        """
+        previous_id = self._highlighted_id
+        self._highlighted_id = product_id
+
+        rows = []
+        if previous_id is not None:
+            rows.append(self.find_row(previous_id))
+        if product_id is not None:
+            # Colors are looked up once per highlight, not once per painted cell
+            self._highlight_colors = (QColor(get_color('highlight')),
+                                      QColor(get_color('background')))
+            rows.append(row if row is not None else self.find_row(product_id))
+
+        for changed_row in rows:
+            if changed_row >= 0:
+                self.dataChanged.emit(self.index(changed_row, 0),
+                                      self.index(changed_row, self.COLUMN_COUNT - 1),
+                                      [Qt.BackgroundRole, Qt.ForegroundRole])
@@ -14,9 +14,25 @@ class StatusBar(QFrame):
       - "select": for select mode (blue text)
     """
 
+    # Message types whose stylesheets are rendered when the theme is set
+    MESSAGE_TYPES = ("success", "error", "warning", "info", "loaded", "select")
+
+    ICON_PATHS = {
+        "success": "resources/check_icon.png",
+        "error": "resources/error_icon.png",
+        "warning": "resources/warning_icon.png",
+        "info": "resources/info_icon.png",
+        "loaded": "resources/info_icon.png",  # You can adjust icons per type
+        "select": "resources/select_icon.png"
+    }
+
+    # Scaled icons shared by all status bars, loaded on first use
+    _icon_cache = {}
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.current_type = "info"
+        self.current_key = None  # Translation key of the message being shown
         self.auto_hide_timer = QTimer(self)
         self.auto_hide_timer.setSingleShot(True)
         self.auto_hide_timer.timeout.connect(self.collapse)
@@ -27,6 +43,14 @@ class StatusBar(QFrame):
         self.animation.setDuration(self.animation_duration)
         self.animation.setEasingCurve(QEasingCurve.OutCubic)
         self.theme = {}  # To be set via set_theme()
+        self._styles = {}  # Rendered stylesheet per message type
+
+        # Coalesce bursts of messages so only the last one within the window is shown
+        self._pending_message = None
+        self._queue_timer = QTimer(self)
+        self._queue_timer.setSingleShot(True)
+        self._queue_timer.setInterval(30)
+        self._queue_timer.timeout.connect(self._flush_queued_message)
 
         self.setup_ui()
         self.setObjectName("statusBar")
@@ -107,8 +131,12 @@ class StatusBar(QFrame):
               "info":    {"bg": <hex>, "border": <hex>, "text": <hex>}
             }
         You can also provide custom types like "loaded" and "select".
+        The stylesheet of every message type is rendered here once, so
+        showing a message only swaps in a prepared string.
         """
         self.theme = theme
+        self._styles = {type: self._get_premium_style(type)
+                        for type in self.MESSAGE_TYPES}
 
     def _lighten_color(self, hex_color, percent):
         """Return a lighter version of the given hex color by the specified percent."""
@@ -152,50 +180,34 @@ class StatusBar(QFrame):
             }}
         """
 
-    def show_message(self, message, type="info", duration=10000):
+    def show_message(self, message, type="info", duration=10000, key=None):
         """
         Expands the status bar to show a message with an icon,
         applies the premium style based on the message type,
         then auto-collapses after `duration` milliseconds.
+        `key` optionally records which translation key produced the message
+        so that owners can re-render it when the language changes.
         """
         if self.auto_hide_timer.isActive():
             self.auto_hide_timer.stop()
+        # A direct message supersedes anything still waiting in the queue
+        self._queue_timer.stop()
+        self._pending_message = None
         self.current_type = type
+        self.current_key = key
 
         # Set the icon based on message type
-        icon_map = {
-            "success": "resources/check_icon.png",
-            "error": "resources/error_icon.png",
-            "warning": "resources/warning_icon.png",
-            "info": "resources/info_icon.png",
-            "loaded": "resources/info_icon.png",  # You can adjust icons per type
-            "select": "resources/select_icon.png"
-        }
-        icon_path = icon_map.get(type, icon_map["info"])
+        icon_path = self.ICON_PATHS.get(type, self.ICON_PATHS["info"])
         try:
-            pix = QPixmap(icon_path).scaled(24, 24, Qt.KeepAspectRatio,
-                                            Qt.SmoothTransformation)
-            self.status_icon.setPixmap(pix)
+            self.status_icon.setPixmap(self._icon(icon_path))
         except Exception:
             self.status_icon.setText("")
 
-        # If the message contains untranslated placeholders, don't crash
-        safe_message = message
-        try:
-            # Check if it's a formatting string with {placeholders}
-            if "{" in message and "}" in message:
-                # Test format with dummy values to see if it's valid
-                try:
-                    test = message.format(count=0, file="test.csv")
-                except KeyError:
-                    # Has placeholders but wrong ones, display as-is
-                    pass
-        except Exception:
-            # If any error occurs, use message as-is
-            pass
-
-        self.status_text.setText(safe_message)
-        self.setStyleSheet(self._get_premium_style(type))
+        self.status_text.setText(message)
+        style = self._styles.get(type)
+        if style is None:
+            style = self._styles[type] = self._get_premium_style(type)
+        self.setStyleSheet(style)
 
         # Animate expansion to show the message
         self.animation.stop()
@@ -206,6 +218,32 @@ class StatusBar(QFrame):
         # Start auto-collapse timer
         self.auto_hide_timer.start(duration)
 
+    @classmethod
+    def _icon(cls, icon_path):
+        """Get the icon at icon_path scaled to the icon label size"""
+        pix = cls._icon_cache.get(icon_path)
+        if pix is None:
+            pix = QPixmap(icon_path).scaled(24, 24, Qt.KeepAspectRatio,
+                                            Qt.SmoothTransformation)
+            cls._icon_cache[icon_path] = pix
+        return pix
+
+    def queue_message(self, message, type="info", duration=10000, key=None):
+        """
+        Queue a message to be shown shortly. If several messages are queued
+        within the coalescing window, only the last one is displayed.
+        """
+        self._pending_message = (message, type, duration, key)
+        self._queue_timer.start()
+
+    def _flush_queued_message(self):
+        """Show the most recently queued message, if any."""
+        if self._pending_message is None:
+            return
+        message, type, duration, key = self._pending_message
+        self._pending_message = None
+        self.show_message(message, type, duration, key)
+
     def collapse(self):
         """
         Animate the collapse back to the slim state and clear the message.
@@ -217,6 +255,7 @@ class StatusBar(QFrame):
         QTimer.singleShot(self.animation_duration, self._clear_message)
 
     def _clear_message(self):
+        self.current_key = None
         self.status_text.setText("")
         self.status_icon.clear()
 
@@ -151,6 +151,12 @@ class AddProductDialog(ElegantDialog):
         self.quantity_input.setValue(1)
         self.price_input.setValue(0.00)
 
+    def reset(self):
+        """Reset the dialog so it can be shown again for a new product."""
+        self.clear_fields()
+        self.product_name_input.setStyleSheet("")
+        self.product_data = {}
+
     def save_product(self):
         """Validate and save product data."""
         # Check required fields
@@ -1,3 +1,5 @@
+import logging
+
 from PyQt5.QtWidgets import QWidget, QDialog
 from PyQt5.QtCore import Qt, QTimer, pyqtSlot
 
@@ -11,9 +13,14 @@ from .product_widget.handlers.selection_handler import SelectionHandler
 from .product_widget.operations.add_operation import AddOperation
 from .product_widget.operations.delete_operation import DeleteOperation
 from .product_widget.operations.export_operation import ExportOperation
+from widgets.workers import DatabaseWorker
 
 from .utils import ProductValidator
 from .dialogs import FilterDialog
+from themes import get_current_theme
+from utils.logging_config import get_logger
+
+logger = get_logger(__name__)
 
 
 class ProductsWidget(QWidget):
@@ -22,6 +29,28 @@ class ProductsWidget(QWidget):
         self._is_closing = False
         self.translator = translator
         self.db = db
+        self._visible_row_count = 0
+        self._highlight_after_load = None
+
+        # The filter dialog is built once and reused until theme or language change
+        self._filter_dialog = None
+        self._filter_dialog_key = None
+
+        # Debounce search so only the last keystroke in a burst filters the table
+        self._pending_search = ""
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self._do_search)
+
+        # Cell edits are queued and written to the database in batches
+        # by a worker thread, keyed by (product_id, field)
+        self._pending_edits = {}
+        self._edit_worker = None
+        self._edit_timer = QTimer(self)
+        self._edit_timer.setSingleShot(True)
+        self._edit_timer.setInterval(300)
+        self._edit_timer.timeout.connect(self._flush_edits)
 
         # Initialize validator
         self.validator = ProductValidator(translator)
@@ -79,6 +108,7 @@ class ProductsWidget(QWidget):
 
         # Connect search signal
         self.search_input.textChanged.connect(self.on_search)
+        self.search_input.returnPressed.connect(self._search_now)
 
         # Connect table signals
         self.product_table.cellChanged.connect(self.on_cell_changed)
@@ -108,32 +138,86 @@ class ProductsWidget(QWidget):
 
     def on_search(self, text):
         """Handle search text changes"""
+        self._pending_search = text
+        self._search_timer.start()
+
+    def _search_now(self):
+        """Run a pending search immediately instead of waiting for the debounce"""
+        if self._search_timer.isActive():
+            self._search_timer.stop()
+            self._do_search()
+
+    def _do_search(self):
+        """Run the search for the most recent search text"""
         filtered_products, message = self.search_handler.search_products(
             self.product_manager.get_products(),
-            text
+            self._pending_search,
+            self.product_manager.get_search_index()
         )
         self.product_table.update_table_data(filtered_products)
+        self._visible_row_count = len(filtered_products)
 
         if message:
-            self.status_bar.show_message(message, "info")
+            self.status_bar.show_message(message, "info", key='search_results')
         else:
             self.status_bar.clear()
 
     def on_cell_changed(self, row, column):
         """Handle cell value changes"""
         success, product_id, field, new_value, message = self.edit_handler.handle_cell_change(
-            row, column, self.product_table.table, self.product_manager.get_products()
+            row, column, self.product_table.model, self.product_manager
         )
 
         if success:
             # Update in-memory product data
             self.product_manager.update_product_in_memory(product_id, field, new_value,
                                                           column)
-            self.status_bar.show_message(message, "success", 3000)
+            self.search_handler.invalidate()
+            self.filter_handler.invalidate()
+
+            # Queue the database write; later edits of the same cell replace it
+            self._pending_edits[(product_id, field)] = new_value
+            self._edit_timer.start()
+
+    def _flush_edits(self):
+        """Write queued cell edits to the database on a worker thread"""
+        if not self._pending_edits:
+            return
+
+        if self._edit_worker and self._edit_worker.isRunning():
+            # Let the running batch finish first
+            self._edit_timer.start()
+            return
+
+        updates = self._pending_edits
+        self._pending_edits = {}
+        self._edit_worker = DatabaseWorker(self.db, "update_batch", updates=updates)
+        self._edit_worker.finished.connect(self._on_edits_saved)
+        self._edit_worker.error.connect(self.show_error)
+        self._edit_worker.start()
+
+    def _flush_edits_now(self):
+        """Write queued cell edits synchronously, e.g. before reloading or closing"""
+        self._edit_timer.stop()
+        if self._edit_worker and self._edit_worker.isRunning():
+            self._edit_worker.wait()
+        if self._pending_edits:
+            updates = self._pending_edits
+            self._pending_edits = {}
+            self.db.update_parts(updates)
+
+    def _on_edits_saved(self, updated):
+        """Report the result of a batch of cell edits"""
+        if updated < 0:
+            self.status_bar.show_message(self.translator.t('save_error'), "error")
+        else:
+            self.status_bar.show_message(self.translator.t('product_updated'),
+                                         "success", 3000)
 
     def show_filter_dialog(self):
         """Show filter dialog"""
-        dialog = FilterDialog(self.translator, self)
+        dialog = self._get_filter_dialog()
+        dialog.reset_filters()
         dialog.initialize_from_saved_settings(
             self.filter_handler.get_last_filter_settings())
 
@@ -142,14 +226,26 @@ class ProductsWidget(QWidget):
             self.filter_handler.save_filter_settings(filters)
             self.apply_filters(filters)
 
+    def _get_filter_dialog(self):
+        """Get the cached filter dialog, rebuilding it if theme or language changed"""
+        key = (get_current_theme(), self.translator.language)
+        if self._filter_dialog is None or self._filter_dialog_key != key:
+            if self._filter_dialog is not None:
+                self._filter_dialog.deleteLater()
+            self._filter_dialog = FilterDialog(self.translator, self)
+            self._filter_dialog_key = key
+        return self._filter_dialog
+
     def apply_filters(self, filters):
         """Apply filters to products"""
         filtered_products, message = self.filter_handler.filter_products(
             self.product_manager.get_products(),
-            filters
+            filters,
+            self.product_manager.get_search_index()
         )
         self.product_table.update_table_data(filtered_products)
-        self.status_bar.show_message(message, "info")
+        self._visible_row_count = len(filtered_products)
+        self.status_bar.show_message(message, "info", key='filter_results')
 
     def delete_selected_products(self):
         """Delete selected products"""
@@ -167,7 +263,9 @@ class ProductsWidget(QWidget):
 
     def load_products(self):
         """Load products from database"""
-        self.status_bar.show_message(self.translator.t('loading_products'), "info")
+        # Make sure queued edits are saved before reading products back
+        self._flush_edits_now()
+        self.status_bar.queue_message(self.translator.t('loading_products'), "info")
         self.product_loader.load_products(self._is_closing)
 
         # Reset filter settings when loading all products
@@ -178,27 +276,66 @@ class ProductsWidget(QWidget):
         """Handle loaded products data"""
         try:
             self.product_manager.set_products(products)
+            products = self.product_manager.get_products()
+            self.search_handler.invalidate()
+            self.filter_handler.invalidate()
             self.product_table.update_table_data(products)
-            self.status_bar.show_message(
+            self._visible_row_count = len(products)
+            self.status_bar.queue_message(
                 self.translator.t('products_loaded').format(count=len(products)),
-                "success"
+                "success",
+                key='products_loaded'
             )
+
+            if self._highlight_after_load is not None:
+                product_id = self._highlight_after_load
+                self._highlight_after_load = None
+                self._highlight_product(product_id)
         except Exception as e:
             print(f"Load error: {e}")
-            self.status_bar.show_message(self.translator.t('load_error'), "error")
+            self.status_bar.queue_message(self.translator.t('load_error'), "error")
 
+    @pyqtSlot(int)
     def on_product_added(self, product_id):
         """Called after a product is added or updated"""
-        self.load_products()
-        QTimer.singleShot(100, lambda: self._highlight_product(product_id))
+        row = self.db.get_part(product_id)
+        if row is None:
+            # Fall back to a full reload, highlighting once the list arrives
+            self._highlight_after_load = product_id
+            self.load_products()
+            return
+
+        # Patch the one product into memory and the table instead of re-fetching all
+        product = self.product_manager.upsert_product(row)
+        self.search_handler.invalidate()
+        self.filter_handler.invalidate()
+        if self.product_table.model.find_row(product_id) < 0:
+            self._visible_row_count += 1
+        self.product_table.upsert_product(product)
+        self._highlight_product(product_id)
 
     def on_products_deleted(self, deleted_ids):
         """Called after products are deleted"""
         # Update in-memory products list
         self.product_manager.remove_products_by_ids(deleted_ids)
-
-        # Reload products
-        self.load_products()
+        self.search_handler.invalidate()
+        self.filter_handler.invalidate()
+
+        # Drop the deleted rows in place instead of rebuilding the whole table
+        expected_count = self.product_table.model.rowCount()
+        removed_rows = self.product_table.remove_rows_by_ids(deleted_ids)
+        expected_count -= removed_rows
+        self._visible_row_count -= removed_rows
+
+        if __debug__ and logger.isEnabledFor(logging.DEBUG):
+            actual_count = self.product_table.model.rowCount()
+            logger.debug("Expected row count: %d, Actual: %d",
+                         expected_count, actual_count)
+            remaining = set(deleted_ids)
+            assert not any(
+                self.product_table.model.product_id(row) in remaining
+                for row in range(actual_count)
+            ), "Deleted products are still shown in the table"
 
     def _highlight_product(self, product_id):
         """Highlight a product in the table"""
@@ -206,16 +343,7 @@ class ProductsWidget(QWidget):
             return
 
         try:
-            # Try to highlight row
-            if hasattr(self.product_table, 'highlight_row_by_id'):
-                self.product_table.highlight_row_by_id(product_id)
-            else:
-                self.product_table.highlight_product(str(product_id))
-
-            # Show loaded message
-            loaded_message = self.translator.t('products_loaded').format(
-                count=len(self.product_manager.get_products()))
-            self.status_bar.show_message(loaded_message, "info", 5000)
+            self.product_table.highlight_row_by_id(product_id)
         except Exception as e:
             print(f"Error highlighting product: {e}")
 
@@ -228,7 +356,7 @@ class ProductsWidget(QWidget):
         """Show error message"""
         if self._is_closing:
             return
-        self.status_bar.show_message(message, "error")
+        self.status_bar.queue_message(message, "error")
 
     def highlight_product(self, search_text):
         """Highlight a product in the table"""
@@ -237,13 +365,32 @@ class ProductsWidget(QWidget):
     def update_translations(self):
         """Update all translations in the UI"""
         self.ui_handler.update_translations()
+        self._retranslate_status_message()
+
+    def _retranslate_status_message(self):
+        """Re-render the status message currently shown in the new language"""
+        key = self.status_bar.current_key
+        total = len(self.product_manager.get_products())
+
+        if key in ('search_results', 'filter_results'):
+            message = self.translator.t(key).format(count=self._visible_row_count,
+                                                    total=total)
+        elif key == 'products_loaded':
+            message = self.translator.t(key).format(count=total)
+        else:
+            return
+
+        self.status_bar.show_message(message, self.status_bar.current_type, key=key)
 
     def closeEvent(self, event):
         """Handle widget close event"""
         try:
             self._is_closing = True
+            self._flush_edits_now()
             if hasattr(self.product_loader, 'cleanup'):
                 self.product_loader.cleanup()
+            self.delete_operation.cleanup()
+            self.export_operation.cleanup()
             self.product_manager.clear()
         except Exception as e:
             print(f"Cleanup error: {e}")
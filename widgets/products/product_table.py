@@ -1,10 +1,9 @@
 from PyQt5.QtWidgets import (QTableView, QAbstractItemView, QHeaderView,
-                             QTableWidget, QTableWidgetItem, QFrame, QVBoxLayout,
-                             QWidget, QAbstractButton)
+                             QFrame, QVBoxLayout, QWidget, QAbstractButton)
 from PyQt5.QtCore import Qt, pyqtSignal
-from PyQt5.QtGui import QColor
-from themes import get_color
+from themes import get_color, get_current_theme
 from .components.table_delegates import ThemedNumericDelegate, ThemedItemDelegate
+from .components.product_model import ProductsTableModel
 
 
 class ProductsTable(QFrame):
@@ -12,9 +11,13 @@ class ProductsTable(QFrame):
 
     cellChanged = pyqtSignal(int, int)  # Row, column
 
+    # Table stylesheets built per theme name, shared by all instances
+    _style_cache = {}
+
     def __init__(self, translator, parent=None):
         super().__init__(parent)
         self.translator = translator
+        self._applied_theme = None
         self.setObjectName("tableContainer")
 
         # Setup layout with no margins for better scrollbar alignment
@@ -22,9 +25,10 @@ class ProductsTable(QFrame):
         layout.setContentsMargins(0, 0, 0, 0)  # Remove all margins
         layout.setSpacing(0)  # Remove spacing
 
-        # Create table widget
-        self.table = QTableWidget()
-        self.table.setColumnCount(7)
+        # Create table view backed by a model, so rows are formatted lazily
+        self.table = QTableView()
+        self.model = ProductsTableModel(self)
+        self.table.setModel(self.model)
         self.update_headers()
 
         # Hide vertical header completely - this removes row numbers
@@ -40,6 +44,8 @@ class ProductsTable(QFrame):
 
         # Set row height to make cells larger
         self.table.verticalHeader().setDefaultSectionSize(40)  # Taller rows
+        # Fixed rows, so the view never measures row contents to size them
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
 
         # Custom column widths instead of stretch
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
@@ -47,7 +53,7 @@ class ProductsTable(QFrame):
         # Configure selection and interaction behavior
         self.table.setSelectionBehavior(QAbstractItemView.SelectItems)
         self.table.setSelectionMode(QAbstractItemView.SingleSelection)
-        self.table.cellChanged.connect(self._on_cell_changed)
+        self.model.cellEdited.connect(self._on_cell_changed)
         self.table.setAlternatingRowColors(True)
 
         # Set edit triggers - make it easier to enter edit mode
@@ -67,6 +73,9 @@ class ProductsTable(QFrame):
         # Remove grid for a sleeker look
         self.table.setShowGrid(False)
 
+        # Sort through the model when a header is clicked
+        self.table.setSortingEnabled(True)
+
         # Disable the corner button - safely try another approach
         try:
             self.table.setCornerButtonEnabled(False)
@@ -100,7 +109,7 @@ class ProductsTable(QFrame):
             self.translator.t('quantity'),
             self.translator.t('price')
         ]
-        self.table.setHorizontalHeaderLabels(headers)
+        self.model.set_headers(headers)
 
     def _on_cell_changed(self, row, column):
         """Internal handler for cell changes that emits the public signal"""
@@ -112,45 +121,22 @@ class ProductsTable(QFrame):
             # Save current scroll position
             scroll_value = self.table.verticalScrollBar().value()
 
-            self.table.blockSignals(True)
-            self.table.setSortingEnabled(False)
-
-            # Set the row count
-            self.table.setRowCount(len(products))
-
-            # Populate the data row by row
-            for row, prod in enumerate(products):
-                # ID column (non-editable)
-                id_item = QTableWidgetItem(str(prod[0]))
-                id_item.setFlags(id_item.flags() ^ Qt.ItemIsEditable)
-                id_item.setTextAlignment(Qt.AlignCenter)  # Center align ID
-                self.table.setItem(row, 0, id_item)
-
-                # Other columns
-                for col in range(1, 5):
-                    text = str(prod[col]) if prod[col] not in [None, ""] else "-"
-                    item = QTableWidgetItem(text)
-                    # Left align text fields
-                    item.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-                    self.table.setItem(row, col, item)
-
-                # Quantity - center align
-                qty_item = QTableWidgetItem(str(prod[5]))
-                qty_item.setTextAlignment(Qt.AlignCenter)
-                self.table.setItem(row, 5, qty_item)
-
-                # Price - right align
-                price_item = QTableWidgetItem(f"{float(prod[6]):.2f}")
-                price_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                self.table.setItem(row, 6, price_item)
-
-            # Re-enable sorting and signals after all data is loaded
-            self.table.setSortingEnabled(True)
-            self.table.blockSignals(False)
-
-            # Restore scroll position if possible
-            self.table.verticalScrollBar().setValue(
-                min(scroll_value, self.table.verticalScrollBar().maximum()))
+            # Reset, re-sort and scroll without painting the steps in between
+            self.table.setUpdatesEnabled(False)
+            try:
+                self.model.set_products(products)
+
+                # Keep the order the user picked by clicking a header
+                header = self.table.horizontalHeader()
+                if header.sortIndicatorSection() >= 0:
+                    self.model.sort(header.sortIndicatorSection(),
+                                    header.sortIndicatorOrder())
+
+                # Restore scroll position if possible
+                self.table.verticalScrollBar().setValue(
+                    min(scroll_value, self.table.verticalScrollBar().maximum()))
+            finally:
+                self.table.setUpdatesEnabled(True)
 
             return True
         except Exception as e:
@@ -159,6 +145,22 @@ class ProductsTable(QFrame):
             print(traceback.format_exc())
             return False
 
+    def upsert_product(self, product):
+        """Refresh the row of a product, or insert it at the top if not shown
+
+        Returns:
+            int: Row showing the product
+        """
+        return self.model.upsert_product(product)
+
+    def remove_rows_by_ids(self, product_ids):
+        """Remove the rows whose ID matches one of the given product IDs
+
+        Returns:
+            int: Number of rows removed
+        """
+        return self.model.remove_ids(product_ids)
+
     def adjust_column_widths(self):
         """Set custom column widths based on data importance"""
         # Total width calculation (approximate)
@@ -200,13 +202,12 @@ class ProductsTable(QFrame):
         for index in selected_rows:
             row = index.row()
             try:
-                id_item = self.table.item(row, 0)
-                name_item = self.table.item(row, 4)
-                if id_item and name_item and id_item.text().isdigit():
-                    product_details.append((
-                        int(id_item.text()),
-                        name_item.text() or self.translator.t('unnamed_product')
-                    ))
+                product = self.model.product_at(row)
+                product_details.append((
+                    int(product[ProductsTableModel.ID_COLUMN]),
+                    product[ProductsTableModel.NAME_COLUMN] or
+                    self.translator.t('unnamed_product')
+                ))
             except Exception as e:
                 print(f"Error parsing row {row}: {e}")
 
@@ -214,23 +215,56 @@ class ProductsTable(QFrame):
 
     def highlight_product(self, search_text):
         """Scroll to and highlight matching product"""
-        search_text = search_text.lower()
-        for row in range(self.table.rowCount()):
-            product_item = self.table.item(row, 4)
-            if product_item and search_text in product_item.text().lower():
-                self.table.scrollToItem(product_item)
-                self.table.blockSignals(True)
-                for col in range(self.table.columnCount()):
-                    item = self.table.item(row, col)
-                    if item:
-                        item.setBackground(QColor(get_color('highlight')))
-                        item.setForeground(QColor(get_color('background')))
-                self.table.blockSignals(False)
+        search_text = search_text.casefold()
+        for row in range(self.model.rowCount()):
+            if search_text in self.model.text(row, ProductsTableModel.NAME_COLUMN).casefold():
+                self._highlight_row(row)
                 return True
         return False
 
+    def highlight_row_by_id(self, product_id):
+        """Scroll to and highlight the row of a product ID"""
+        row = self.model.find_row(product_id)
+        if row < 0:
+            return False
+        self._highlight_row(row)
+        return True
+
+    def _highlight_row(self, row):
+        """Scroll to a row and paint it with the highlight colors"""
+        self.table.scrollTo(self.model.index(row, ProductsTableModel.NAME_COLUMN))
+        self.model.set_highlighted_id(self.model.product_id(row), row)
+
     def apply_theme(self):
         """Apply current theme to table with enhanced styling"""
+        theme_name = get_current_theme()
+        if theme_name == self._applied_theme:
+            # Re-setting an identical stylesheet would still re-polish every cell
+            return
+
+        styles = ProductsTable._style_cache.get(theme_name)
+        if styles is None:
+            styles = self._build_table_styles()
+            ProductsTable._style_cache[theme_name] = styles
+        table_style, bg_color = styles
+
+        self.table.setStyleSheet(table_style)
+
+        # As a fallback, directly set the background of the table viewport
+        self.table.viewport().setStyleSheet(f"background: {bg_color};")
+
+        # Style all child widgets to prevent any white boxes
+        for child in self.table.findChildren(QWidget):
+            child.setStyleSheet(f"background-color: {bg_color}; border: none;")
+
+        self._applied_theme = theme_name
+
+    def _build_table_styles(self):
+        """Build the table stylesheet from the current theme colors
+
+        Returns:
+            tuple: (table_style, background_color)
+        """
         bg_color = get_color('background')
         text_color = get_color('text')
         border_color = get_color('border')
@@ -239,7 +273,7 @@ class ProductsTable(QFrame):
 
         # Table styling with refined cell appearance
         table_style = f"""
-            QTableWidget {{
+            QTableView {{
                 background-color: {bg_color};
                 alternate-background-color: {secondary_color};
                 gridline-color: {border_color};
@@ -247,7 +281,7 @@ class ProductsTable(QFrame):
                 border-radius: 6px;
                 font-size: 14px;
             }}
-            QTableWidget::item {{
+            QTableView::item {{
                 padding: 0px;
                 border: none;
             }}
@@ -260,7 +294,7 @@ class ProductsTable(QFrame):
                 font-weight: bold;
                 font-size: 15px;
             }}
-            QTableWidget::item:selected {{
+            QTableView::item:selected {{
                 background-color: {highlight_color};
                 color: {bg_color};
             }}
@@ -273,7 +307,7 @@ class ProductsTable(QFrame):
                 border: none;
             }}
             /* Smoother hover effect */
-            QTableWidget::item:hover:!selected {{
+            QTableView::item:hover:!selected {{
                 background-color: {highlight_color}25;
             }}
 
@@ -350,19 +384,12 @@ class ProductsTable(QFrame):
             }}
 
             /* Style any other potential widgets in the table */
-            QTableWidget > QWidget {{
+            QTableView > QWidget {{
                 background-color: {bg_color};
                 border: none;
             }}
         """
-        self.table.setStyleSheet(table_style)
-
-        # As a fallback, directly set the background of the table viewport
-        self.table.viewport().setStyleSheet(f"background: {bg_color};")
-
-        # Style all child widgets to prevent any white boxes
-        for child in self.table.findChildren(QWidget):
-            child.setStyleSheet(f"background-color: {bg_color}; border: none;")
+        return table_style, bg_color
 
     def resizeEvent(self, event):
         """Handle resize events to adjust column widths"""
@@ -1,3 +1,5 @@
 # Core module imports
 from .product_loader import ProductLoader
-from .product_manager import ProductManager
\ No newline at end of file
+from .product_manager import ProductManager
+from .search_index import SearchIndex
+from .product import Product
\ No newline at end of file
@@ -0,0 +1,65 @@
+from operator import attrgetter
+
+# Product fields, in the column order of the parts table
+FIELDS = ("id", "category", "car_name", "model", "product_name", "quantity", "price",
+          "last_updated")
+
+# Column position of each field
+FIELD_INDEX = {name: i for i, name in enumerate(FIELDS)}
+
+# Getter for each field by column position; a C-level call per read, for hot
+# paths that only know the column number
+FIELD_GETTERS = tuple(attrgetter(name) for name in FIELDS)
+
+# Reads all fields at once, in column order, as a tuple
+_all_fields = attrgetter(*FIELDS)
+
+
+class Product:
+    """A single product record
+
+    Fields can be read and updated in place by name, and also by position
+    like the database row it was created from (0=id ... 6=price), so code
+    written against row tuples keeps working.
+    """
+
+    __slots__ = FIELDS
+
+    def __init__(self, id, category, car_name, model, product_name, quantity=0,
+                 price=0.0, last_updated=None):
+        self.id = id
+        self.category = category
+        self.car_name = car_name
+        self.model = model
+        self.product_name = product_name
+        self.quantity = quantity
+        self.price = price
+        self.last_updated = last_updated
+
+    @classmethod
+    def from_row(cls, row):
+        """Create a product from a database row, or return it if already a Product"""
+        if isinstance(row, cls):
+            return row
+        return cls(*row)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return _all_fields(self)[index]
+        return FIELD_GETTERS[index](self)
+
+    def __setitem__(self, index, value):
+        setattr(self, FIELDS[index], value)
+
+    def __len__(self):
+        return len(FIELDS)
+
+    def __iter__(self):
+        return iter(_all_fields(self))
+
+    def copy(self):
+        """Get a separate product with the same field values"""
+        return Product(*_all_fields(self))
+
+    def __repr__(self):
+        return f"Product({', '.join(repr(value) for value in self)})"
@@ -13,6 +13,8 @@ class ProductLoader(QObject):
         super().__init__(parent)
         self.db = db
         self.worker_thread = None
+        self._previous_worker = None
+        self._pending_reload = False
 
     def load_products(self, is_closing=False):
         """Load products from database using worker thread"""
@@ -22,14 +24,22 @@ class ProductLoader(QObject):
             return
 
         if self.worker_thread and self.worker_thread.isRunning():
-            print("Stopping existing worker thread")
-            self.worker_thread.quit()
-            self.worker_thread.wait(1000)
+            # The running query can't be interrupted; reload once it finishes
+            # instead of blocking the UI waiting for it
+            print("Load already running, reloading when it finishes")
+            self._pending_reload = True
+            return
+
+        self._start_worker()
 
+    def _start_worker(self):
+        """Start a worker thread that loads all products"""
         try:
+            # Keep the previous worker alive until its thread has fully exited
+            self._previous_worker = self.worker_thread
             self.worker_thread = DatabaseWorker(self.db, "load")
-            self.worker_thread.finished.connect(self.products_loaded.emit)
-            self.worker_thread.error.connect(self.error_occurred.emit)
+            self.worker_thread.finished.connect(self._on_worker_finished)
+            self.worker_thread.error.connect(self._on_worker_error)
             self.worker_thread.start()
             print("Worker thread started for loading products")
 
@@ -44,25 +54,37 @@ class ProductLoader(QObject):
                 print(f"Direct loading also failed: {direct_error}")
                 self.error_occurred.emit("Failed to load products")
 
+    def _on_worker_finished(self, products):
+        """Emit loaded products, or start the reload requested meanwhile"""
+        if self._pending_reload:
+            # These results predate the latest request, fetch again
+            self._pending_reload = False
+            self._start_worker()
+            return
+        self.products_loaded.emit(products)
+
+    def _on_worker_error(self, message):
+        """Report a load error, unless a newer reload is already pending"""
+        if self._pending_reload:
+            self._pending_reload = False
+            self._start_worker()
+            return
+        self.error_occurred.emit(message)
+
     def emergency_reload(self):
-        """Emergency reload of products when normal loading fails"""
+        """Emergency reload of products when normal loading fails
+
+        The products are read on a worker thread and delivered through
+        products_loaded, so the GUI thread never blocks on the query.
+        """
         print("Emergency reload initiated")
-        try:
-            import gc
-            gc.collect()
-            products = self.db.get_all_parts()
-            print(f"Loaded {len(products)} products directly from database")
-            self.products_loaded.emit(products)
-            return products
-        except Exception as e:
-            print(f"Emergency reload failed: {e}")
-            import traceback
-            print(traceback.format_exc())
-            self.error_occurred.emit(f"Emergency reload failed: {str(e)}")
-            return []
+        import gc
+        gc.collect()
+        self.load_products()
 
     def cleanup(self):
         """Clean up resources before closing"""
+        self._pending_reload = False
         if self.worker_thread and self.worker_thread.isRunning():
             self.worker_thread.quit()
             self.worker_thread.wait(1000)
\ No newline at end of file
@@ -1,58 +1,106 @@
+from .product import Product, FIELD_INDEX
+from .search_index import SearchIndex
+
+
 class ProductManager:
     """Manages the product data and operations"""
 
     def __init__(self, db):
         self.db = db
         self.all_products = []
+        self.search_index = SearchIndex()
+        self._id_to_index = {}
 
     def set_products(self, products):
-        """Set the current product list"""
-        self.all_products = products
+        """Set the current product list from database rows"""
+        self.all_products = [Product.from_row(row) for row in products]
+        self.search_index = SearchIndex(self.all_products)
+        self._rebuild_id_index()
 
     def get_products(self):
         """Get the current product list"""
         return self.all_products
 
+    def get_product(self, product_id):
+        """Get the in-memory product with the given ID, or None"""
+        i = self._id_to_index.get(product_id)
+        return self.all_products[i] if i is not None else None
+
+    def get_search_index(self):
+        """Get the lowercase search index matching the current product list"""
+        return self.search_index
+
+    def _rebuild_id_index(self):
+        """Rebuild the product ID to list position lookup"""
+        self._id_to_index = {prod.id: i for i, prod in enumerate(self.all_products)}
+
     def update_product_in_memory(self, product_id, field, value, column_index=None):
         """Update a product in the in-memory list"""
-        for i, prod in enumerate(self.all_products):
-            if prod[0] == product_id:
-                prod_list = list(prod)
-
-                # Handle special data types
-                if field == 'quantity' or column_index == 5:
-                    prod_list[5] = int(value)
-                elif field == 'price' or column_index == 6:
-                    prod_list[6] = float(value)
-                elif column_index is not None:
-                    prod_list[column_index] = value
-                else:
-                    # Map field name to index if column_index not provided
-                    field_map = {
-                        'category': 1,
-                        'car_name': 2,
-                        'model': 3,
-                        'product_name': 4,
-                        'quantity': 5,
-                        'price': 6
-                    }
-                    if field in field_map:
-                        prod_list[field_map[field]] = value
-
-                self.all_products[i] = tuple(prod_list)
-                return True
-
-        return False
+        i = self._id_to_index.get(product_id)
+        if i is None:
+            return False
+
+        product = self.all_products[i]
+
+        if column_index is None:
+            column_index = FIELD_INDEX.get(field)
+
+        # Handle special data types
+        if column_index == 5:
+            product.quantity = int(value)
+        elif column_index == 6:
+            product.price = float(value)
+        elif column_index is not None:
+            product[column_index] = value
+
+        self.search_index.update(i, product)
+        return True
+
+    def upsert_product(self, row):
+        """Add a product from a database row, or refresh it if already loaded
+
+        Returns:
+            Product: The in-memory product
+        """
+        product = Product.from_row(row)
+        i = self._id_to_index.get(product.id)
+        if i is None:
+            self._id_to_index[product.id] = len(self.all_products)
+            self.all_products.append(product)
+            self.search_index.append(product)
+            return product
+
+        existing = self.all_products[i]
+        for col in range(len(product)):
+            existing[col] = product[col]
+        self.search_index.update(i, existing)
+        return existing
 
     def remove_products_by_ids(self, product_ids):
         """Remove products with the given IDs from the in-memory list"""
         if not product_ids:
             return 0
 
-        original_count = len(self.all_products)
-        self.all_products = [p for p in self.all_products if p[0] not in product_ids]
-        return original_count - len(self.all_products)
+        # Hash lookups per product instead of scanning the ID list each time
+        ids = frozenset(product_ids)
+        removed_positions = [self._id_to_index[pid] for pid in ids
+                             if pid in self._id_to_index]
+        if not removed_positions:
+            return 0
+
+        keep = [i for i, p in enumerate(self.all_products) if p.id not in ids]
+        self.all_products = [self.all_products[i] for i in keep]
+        self.search_index.keep(keep)
+
+        # Only products after the first removed one changed position
+        for pid in ids:
+            self._id_to_index.pop(pid, None)
+        for i in range(min(removed_positions), len(self.all_products)):
+            self._id_to_index[self.all_products[i].id] = i
+        return len(removed_positions)
 
     def clear(self):
         """Clear all products"""
-        self.all_products = []
\ No newline at end of file
+        self.all_products = []
+        self.search_index = SearchIndex()
+        self._id_to_index = {}
\ No newline at end of file
@@ -0,0 +1,71 @@
+"""Numba-compiled substring scan used for very large product catalogs
+
+Numba is optional and only imported the first time a scan is requested,
+since importing and compiling it takes noticeably longer than a normal
+search on a small catalog.
+"""
+import importlib.util
+
+HAVE_NUMBA = (importlib.util.find_spec("numba") is not None
+              and importlib.util.find_spec("numpy") is not None)
+
+# Needles up to this many bytes are matched with the Shift-Or kernel; the
+# Horspool skip can never exceed the needle length, so short needles gain
+# little from it
+SHIFT_OR_MAX_NEEDLE = 8
+
+_scan = None
+_scan_short = None
+
+
+def _compile():
+    """Load the compiled scan kernels, returning the Horspool and Shift-Or scans"""
+    # Importing the kernel module imports Numba; the kernels themselves are
+    # compiled on first call, or loaded from Numba's on-disk cache
+    from . import scan_kernel_numba
+
+    return scan_kernel_numba.scan, scan_kernel_numba.scan_short
+
+
+def _shift_or_masks(needle_arr):
+    """Build the Shift-Or mask table: bit j of masks[b] is clear if needle[j] == b"""
+    import numpy as np
+
+    masks = np.full(256, np.iinfo(np.uint64).max, dtype=np.uint64)
+    for j, byte in enumerate(needle_arr):
+        masks[byte] &= ~np.uint64(1 << j)
+    return masks
+
+
+def scan_rows(blob, offsets, needle):
+    """Return the rows whose bytes contain needle
+
+    Args:
+        blob: uint8 array of all rows' UTF-8 bytes, back to back
+        offsets: int64 array with the start of each row plus the blob length
+        needle: UTF-8 encoded bytes to look for
+
+    Returns:
+        list: Row positions containing needle, in order
+    """
+    global _scan, _scan_short
+    import numpy as np
+
+    if _scan is None:
+        _scan, _scan_short = _compile()
+
+    needle_arr = np.frombuffer(needle, dtype=np.uint8)
+    m = len(needle_arr)
+    out = np.zeros(len(offsets) - 1, dtype=np.bool_)
+
+    if 0 < m <= SHIFT_OR_MAX_NEEDLE:
+        _scan_short(blob, offsets, _shift_or_masks(needle_arr),
+                    np.uint64(1 << (m - 1)), out)
+        return np.flatnonzero(out).tolist()
+
+    skip = np.full(256, m, dtype=np.int64)
+    for i in range(m - 1):
+        skip[needle_arr[i]] = m - 1 - i
+
+    _scan(blob, offsets, needle_arr, skip, out)
+    return np.flatnonzero(out).tolist()
@@ -0,0 +1,47 @@
+"""Numba kernels behind scan_kernel.scan_rows
+
+Only imported by scan_kernel once a scan is requested. The kernels are
+module-level functions, since Numba can only cache compiled code to disk
+for those, not for closures.
+"""
+import numba
+
+
+@numba.njit(cache=True)
+def contains(blob, start, end, needle, skip):
+    # Boyer-Moore-Horspool search of needle within blob[start:end]
+    m = len(needle)
+    last = m - 1
+    pos = start
+    while pos + m <= end:
+        j = last
+        while j >= 0 and blob[pos + j] == needle[j]:
+            j -= 1
+        if j < 0:
+            return True
+        pos += skip[blob[pos + last]]
+    return False
+
+
+@numba.njit(parallel=True, cache=True)
+def scan(blob, offsets, needle, skip, out):
+    for i in numba.prange(len(out)):
+        out[i] = contains(blob, offsets[i], offsets[i + 1], needle, skip)
+
+
+@numba.njit(cache=True)
+def shift_or_contains(blob, start, end, masks, found_bit):
+    # Shift-Or search: bit j of state is clear while the last j + 1 bytes
+    # match the start of the needle
+    state = ~numba.uint64(0)
+    for pos in range(start, end):
+        state = (state << numba.uint64(1)) | masks[blob[pos]]
+        if state & found_bit == 0:
+            return True
+    return False
+
+
+@numba.njit(parallel=True, cache=True)
+def scan_short(blob, offsets, masks, found_bit, out):
+    for i in numba.prange(len(out)):
+        out[i] = shift_or_contains(blob, offsets[i], offsets[i + 1], masks, found_bit)
@@ -0,0 +1,237 @@
+from bisect import bisect_right
+from itertools import compress, repeat
+from operator import contains
+
+from utils.logging_config import get_logger
+from . import scan_kernel
+from .product import FIELD_GETTERS
+
+try:
+    import numpy as np
+    HAVE_NUMPY = True
+except ImportError:
+    HAVE_NUMPY = False
+
+# Above this many products, searches scan one joined string instead of
+# testing each entry separately
+BLOB_SCAN_THRESHOLD = 5000
+
+# Above this many products, searches use the Numba kernel when it is
+# installed. Below it the joined-string scan takes under 2 ms, too little
+# for the kernel's thread start-up to pay off
+NUMBA_SCAN_THRESHOLD = 50000
+
+# Separator between entries in the joined string; never typed by users
+_SEPARATOR = "\x00"
+
+logger = get_logger(__name__)
+
+
+def _to_float(value):
+    """Parse a price, treating empty or invalid values as 0"""
+    try:
+        return float(value) if value else 0.0
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _to_int(value):
+    """Parse a quantity, treating empty or invalid values as 0"""
+    try:
+        return int(value) if value else 0
+    except (TypeError, ValueError):
+        return 0
+
+
+class SearchIndex:
+    """Precomputed lowercase searchable text for each product
+
+    Text is lowercased with str.casefold() rather than str.lower(), so
+    caseless matches such as "ß" and "ss" are also found. Queries must be
+    casefolded the same way before they're matched against the index.
+
+    Holds one lowercase column per text field, one combined entry per
+    product, and the parsed price and quantity of each product. All are kept
+    in the same order as the product list they were built from, so a
+    matching position is also the product's index in that list.
+    """
+
+    # category, car_name, model, product_name
+    FIELDS = (1, 2, 3, 4)
+
+    # category, car_name, model: few distinct values shared by many products
+    GROUPED_FIELDS = (1, 2, 3)
+
+    # Grouping only pays off when values repeat; above this share of
+    # distinct values a column is scanned row by row instead
+    GROUPED_MAX_DISTINCT_RATIO = 0.25
+
+    def __init__(self, products=()):
+        self.columns = {}
+        for col in self.FIELDS:
+            get_value = FIELD_GETTERS[col]
+            self.columns[col] = [str(get_value(product) or "").casefold()
+                                 for product in products]
+        self.entries = [" ".join(values) for values in
+                        zip(*(self.columns[col] for col in self.FIELDS))]
+        self.prices = [_to_float(product.price) for product in products]
+        self.quantities = [_to_int(product.quantity) for product in products]
+        self._blob = None
+        self._starts = None
+        self._byte_blob = None
+        self._arrays = None
+        self._groups = {}
+
+    @classmethod
+    def _folded_values(cls, product):
+        """Casefold the text fields of a single product, in FIELDS order"""
+        return [str(FIELD_GETTERS[col](product) or "").casefold() for col in cls.FIELDS]
+
+    def column(self, col):
+        """Get the lowercase values of a text field for all products"""
+        return self.columns[col]
+
+    def __len__(self):
+        return len(self.entries)
+
+    def update(self, position, product):
+        """Refresh the entry at position after its product changed"""
+        values = self._folded_values(product)
+        for col, value in zip(self.FIELDS, values):
+            self.columns[col][position] = value
+        # The entry is the casefolded columns joined, so no second casefold()
+        self.entries[position] = " ".join(values)
+        self.prices[position] = _to_float(product.price)
+        self.quantities[position] = _to_int(product.quantity)
+        self._invalidate_caches()
+
+    def append(self, product):
+        """Add the entry of a product appended to the product list"""
+        values = self._folded_values(product)
+        for col, value in zip(self.FIELDS, values):
+            self.columns[col].append(value)
+        self.entries.append(" ".join(values))
+        self.prices.append(_to_float(product.price))
+        self.quantities.append(_to_int(product.quantity))
+        self._invalidate_caches()
+
+    def value_groups(self, col):
+        """Map each distinct lowercase value of a column to its positions
+
+        Built on first use and kept until an entry changes. Returns None for
+        columns that aren't grouped or whose values are mostly distinct.
+        """
+        if col not in self.GROUPED_FIELDS:
+            return None
+
+        groups = self._groups.get(col)
+        if groups is None:
+            groups = {}
+            for i, value in enumerate(self.columns[col]):
+                groups.setdefault(value, []).append(i)
+            if len(groups) > len(self.entries) * self.GROUPED_MAX_DISTINCT_RATIO:
+                groups = False
+            self._groups[col] = groups
+        return groups or None
+
+    def keep(self, positions):
+        """Keep only the entries at positions, in that order
+
+        Used when products are removed, so the remaining entries are reused
+        rather than rebuilt from their products.
+        """
+        for col in self.FIELDS:
+            values = self.columns[col]
+            self.columns[col] = [values[i] for i in positions]
+        self.entries = [self.entries[i] for i in positions]
+        self.prices = [self.prices[i] for i in positions]
+        self.quantities = [self.quantities[i] for i in positions]
+        self._invalidate_caches()
+
+    def _invalidate_caches(self):
+        """Drop the joined and array forms built from the entries"""
+        self._blob = None
+        self._starts = None
+        self._byte_blob = None
+        self._arrays = None
+        self._groups = {}
+
+    def find_all(self, needle):
+        """Return the positions of all entries containing needle"""
+        if len(self.entries) < BLOB_SCAN_THRESHOLD or _SEPARATOR in needle:
+            # map/compress keep the per-entry loop in C, with no bytecode per entry
+            return list(compress(range(len(self.entries)),
+                                 map(contains, self.entries, repeat(needle))))
+
+        if scan_kernel.HAVE_NUMBA and len(self.entries) >= NUMBA_SCAN_THRESHOLD:
+            blob, offsets = self._get_byte_blob()
+            try:
+                return scan_kernel.scan_rows(blob, offsets, needle.encode("utf-8"))
+            except Exception:
+                # A broken Numba install or a failed compile must not break
+                # search; use the string scan below from now on
+                logger.exception("Numba scan failed, falling back to the string scan")
+                scan_kernel.HAVE_NUMBA = False
+
+        blob, starts = self._get_blob()
+        matches = []
+        pos = blob.find(needle)
+        while pos != -1:
+            row = bisect_right(starts, pos) - 1
+            matches.append(row)
+            # One hit per entry is enough, continue from the next entry
+            next_row = row + 1
+            if next_row >= len(starts):
+                break
+            pos = blob.find(needle, starts[next_row])
+        return matches
+
+    def find_in(self, needle, positions):
+        """Return the subset of positions whose entries contain needle"""
+        entries = self.entries
+        return [i for i in positions if needle in entries[i]]
+
+    def arrays(self):
+        """Get NumPy arrays of the UTF-8 text columns, prices and quantities
+
+        The arrays are built on first use and kept until an entry changes.
+        Only available when NumPy is installed.
+        """
+        if self._arrays is None:
+            # Text columns are UTF-8 bytes: a quarter of the memory of NumPy's
+            # UCS-4 strings to scan, and substring matches are unchanged
+            arrays = {col: np.array([value.encode("utf-8") for value in self.columns[col]],
+                                    dtype=bytes)
+                      for col in self.FIELDS}
+            # The numeric columns were parsed once when the index was built,
+            # so these are straight copies with no per-row conversion
+            arrays['price'] = np.fromiter(self.prices, dtype=np.float64,
+                                          count=len(self.prices))
+            arrays['quantity'] = np.fromiter(self.quantities, dtype=np.int64,
+                                             count=len(self.quantities))
+            self._arrays = arrays
+        return self._arrays
+
+    def _get_byte_blob(self):
+        """Get the entries as one UTF-8 byte array, with each entry's start offset"""
+        if self._byte_blob is None:
+            encoded = [text.encode("utf-8") for text in self.entries]
+            offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+            np.cumsum([len(data) + 1 for data in encoded], out=offsets[1:])
+            # The last entry has no trailing separator
+            offsets[-1] -= 1
+            blob = np.frombuffer(_SEPARATOR.encode().join(encoded), dtype=np.uint8)
+            self._byte_blob = (blob, offsets)
+        return self._byte_blob
+
+    def _get_blob(self):
+        """Join all entries into one string, with the start offset of each entry"""
+        if self._blob is None:
+            starts = []
+            offset = 0
+            for text in self.entries:
+                starts.append(offset)
+                offset += len(text) + 1
+            self._blob = _SEPARATOR.join(self.entries)
+            self._starts = starts
+        return self._blob, self._starts
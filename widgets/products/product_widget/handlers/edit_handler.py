@@ -1,3 +1,9 @@
+from ..core.product import FIELDS
+
+# Columns 1 (category) through 6 (price) can be edited; 0 is the ID
+LAST_EDITABLE_COLUMN = 6
+
+
 class EditHandler:
     """Handles product editing functionality"""
 
@@ -5,103 +11,76 @@ class EditHandler:
         self.translator = translator
         self.db = db
 
-    def handle_cell_change(self, row, column, table, all_products):
+    def handle_cell_change(self, row, column, model, product_manager):
         """
-        Handle cell change in the product table
+        Validate and parse a cell change in the product table.
+        The database write is left to the caller so edits can be batched.
 
         Args:
             row: Row index
             column: Column index
-            table: Product table widget
-            all_products: List of all products
+            model: Product table model
+            product_manager: ProductManager holding the in-memory products
 
         Returns:
             tuple: (success, product_id, field, new_value, message)
         """
-        if row < 0 or column < 0 or row >= table.rowCount() or column >= table.columnCount():
+        if row < 0 or column < 0 or row >= model.rowCount() or column >= model.columnCount():
             return False, None, None, None, None
 
         if column == 0:  # Skip ID column
             return False, None, None, None, None
 
         try:
-            item = table.item(row, column)
-            id_item = table.item(row, 0)
-
-            if not item or not id_item:
-                return False, None, None, None, None
-
             try:
-                part_id = int(id_item.text())
+                part_id = int(model.product_id(row))
             except (ValueError, TypeError):
                 return False, None, None, None, None
 
-            field_map = {
-                1: 'category',
-                2: 'car_name',
-                3: 'model',
-                4: 'product_name',
-                5: 'quantity',
-                6: 'price'
-            }
-
-            field = field_map.get(column)
-            if not field:
+            if column > LAST_EDITABLE_COLUMN:
                 return False, None, None, None, None
+            field = FIELDS[column]
 
-            new_value = item.text().strip()
+            value = model.value(row, column)
+            new_value = str(value).strip() if value is not None else ""
 
             # Handle special field types
             if field == 'quantity':
                 try:
                     new_value = int(new_value)
                 except ValueError:
-                    table.blockSignals(True)
-                    item.setText('0')
-                    table.blockSignals(False)
+                    model.set_value(row, column, 0)
                     new_value = 0
 
             elif field == 'price':
                 try:
                     new_value = float(new_value)
                 except ValueError:
-                    table.blockSignals(True)
-                    item.setText('0.0')
-                    table.blockSignals(False)
+                    model.set_value(row, column, 0.0)
                     new_value = 0.0
 
             # Ensure product name is not empty
             if field == 'product_name' and not new_value:
-                original_part = self.db.get_part(part_id)
-                original_name = original_part[4] if original_part else "Product"
-                table.blockSignals(True)
-                item.setText(original_name)
-                table.blockSignals(False)
+                original_part = product_manager.get_product(part_id)
+                original_name = original_part.product_name if original_part else "Product"
+                model.set_value(row, column, original_name)
                 return False, None, None, None, None
 
-            # Update the database
-            update_data = {field: new_value}
-            success = self.db.update_part(part_id, **update_data)
-
-            if success:
-                # Format display if necessary
-                if field == 'quantity':
-                    table.blockSignals(True)
-                    item.setText(str(int(new_value)))
-                    table.blockSignals(False)
-                elif field == 'price':
-                    table.blockSignals(True)
-                    item.setText(f"{float(new_value):.2f}")
-                    table.blockSignals(False)
-
-                # Show success message
-                success_message = self.translator.t('product_updated')
-                return True, part_id, field, new_value, success_message
+            # Store the parsed value so the cell shows its formatted form.
+            # The caller is responsible for writing it to the database.
+            model.set_value(row, column, new_value)
 
-            return False, None, None, None, None
+            # Nothing to save when the edit parses back to the stored value,
+            # e.g. "5" retyped as "5.0" in the price column
+            original_part = product_manager.get_product(part_id)
+            if original_part is not None and original_part[column] == new_value:
+                return False, None, None, None, None
+
+            success_message = self.translator.t('product_updated')
+            return True, part_id, field, new_value, success_message
 
         except Exception as e:
             print(f"Error handling cell change: {e}")
             import traceback
             print(traceback.format_exc())
-            return False, None, None, None, None
\ No newline at end of file
+            return False, None, None, None, None
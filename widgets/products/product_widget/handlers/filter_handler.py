@@ -1,3 +1,46 @@
+from collections import OrderedDict
+
+from utils.logging_config import get_logger
+from ..core.search_index import SearchIndex
+
+try:
+    import numpy as np
+    HAVE_NUMPY = True
+except ImportError:
+    HAVE_NUMPY = False
+
+# From this many products on, filters are evaluated as NumPy masks
+VECTORIZE_THRESHOLD = 250
+
+# Text filters and the product column each one is matched against
+TEXT_FILTER_COLUMNS = (
+    ("category", 1),
+    ("name", 4),
+    ("car_name", 2),
+    ("model", 3)
+)
+
+# Number of distinct filter settings whose results are remembered
+RESULT_CACHE_SIZE = 32
+
+FILTER_KEYS = ("category", "name", "car_name", "model", "min_price", "max_price",
+               "stock_status")
+
+logger = get_logger(__name__)
+
+
+def _text_needles(filters):
+    """Get (column, lowercase needle) for each active text filter
+
+    Longer needles usually match fewer products, so they come first and
+    leave less work for the checks after them.
+    """
+    needles = [(col, filters[key].casefold()) for key, col in TEXT_FILTER_COLUMNS
+               if filters[key]]
+    needles.sort(key=lambda item: len(item[1]), reverse=True)
+    return needles
+
+
 class FilterHandler:
     """Handles product filtering functionality"""
 
@@ -12,6 +55,12 @@ class FilterHandler:
             "max_price": None,
             "stock_status": None
         }
+        # Most recently used filter results, keyed by product list and settings
+        self._result_cache = OrderedDict()
+
+    def invalidate(self):
+        """Forget the memoized filter results after the product list changes"""
+        self._result_cache.clear()
 
     def get_last_filter_settings(self):
         """Get the last filter settings used"""
@@ -33,58 +82,28 @@ class FilterHandler:
             "stock_status": None
         }
 
-    def filter_products(self, all_products, filters):
+    def filter_products(self, all_products, filters, search_index=None):
         """
         Filter products based on criteria
 
         Args:
             all_products: List of all products
             filters: Dictionary of filter settings
+            search_index: Optional SearchIndex built from all_products
 
         Returns:
             tuple: (filtered_products, message)
         """
         try:
-            filtered = []
-            for prod in all_products:
-                category = prod[1] if prod[1] else ""
-                name = prod[4] if prod[4] else ""
-                car_name = prod[2] if prod[2] else ""
-                model = prod[3] if prod[3] else ""
-                price = float(prod[6]) if prod[6] else 0
-                quantity = int(prod[5]) if prod[5] else 0
-
-                # Check category
-                if filters["category"] and filters[
-                    "category"].lower() not in category.lower():
-                    continue
-
-                # Check name
-                if filters["name"] and filters["name"].lower() not in name.lower():
-                    continue
-
-                # Check car name
-                if filters["car_name"] and filters[
-                    "car_name"].lower() not in car_name.lower():
-                    continue
-
-                # Check model
-                if filters["model"] and filters["model"].lower() not in model.lower():
-                    continue
-
-                # Check price range
-                if filters["min_price"] is not None and price < filters["min_price"]:
-                    continue
-                if filters["max_price"] is not None and price > filters["max_price"]:
-                    continue
-
-                # Check stock status
-                if filters["stock_status"] == "in_stock" and quantity <= 0:
-                    continue
-                if filters["stock_status"] == "out_of_stock" and quantity > 0:
-                    continue
-
-                filtered.append(prod)
+            cache_key = (id(all_products),) + tuple(filters[key] for key in FILTER_KEYS)
+            filtered = self._result_cache.get(cache_key)
+            if filtered is not None:
+                self._result_cache.move_to_end(cache_key)
+            else:
+                filtered = self._apply_filters(all_products, filters, search_index)
+                self._result_cache[cache_key] = filtered
+                if len(self._result_cache) > RESULT_CACHE_SIZE:
+                    self._result_cache.popitem(last=False)
 
             message = self.translator.t('filter_results').format(
                 count=len(filtered),
@@ -92,8 +111,124 @@ class FilterHandler:
             )
             return filtered, message
 
-        except Exception as e:
-            print("Error filtering products:", e)
-            import traceback
-            print(traceback.format_exc())
-            return all_products, self.translator.t('filter_error')
\ No newline at end of file
+        except Exception:
+            logger.exception("Error filtering products")
+            return all_products, self.translator.t('filter_error')
+
+    def _apply_filters(self, all_products, filters, search_index):
+        """Return the products matching all filters"""
+        if search_index is None:
+            search_index = SearchIndex(all_products)
+
+        candidates, needles = self._match_grouped_columns(
+            _text_needles(filters), search_index)
+        if candidates is not None and not candidates:
+            return []
+
+        if HAVE_NUMPY and len(all_products) >= VECTORIZE_THRESHOLD:
+            return self._apply_filters_vectorized(all_products, filters, search_index,
+                                                  needles, candidates)
+
+        # One pass per predicate over the positions still matching, so each
+        # check is a C-level filter() call and later checks see fewer rows
+        positions = range(len(all_products)) if candidates is None else candidates
+        for predicate in self._build_predicates(filters, search_index, needles):
+            positions = list(filter(predicate, positions))
+            if not positions:
+                break
+        return [all_products[i] for i in positions]
+
+    def _match_grouped_columns(self, needles, search_index):
+        """Resolve text filters on repetitive columns through their distinct values
+
+        A needle is tested once per distinct value rather than once per
+        product, and the positions of every matching value are collected.
+
+        Returns:
+            tuple: (candidates, remaining_needles) where candidates is a sorted
+            list of positions passing the grouped filters, or None if no
+            filter could be grouped
+        """
+        candidates = None
+        remaining = []
+        for col, needle in needles:
+            groups = search_index.value_groups(col)
+            if groups is None:
+                remaining.append((col, needle))
+                continue
+
+            hits = set()
+            for value, positions in groups.items():
+                if needle in value:
+                    hits.update(positions)
+            candidates = hits if candidates is None else candidates & hits
+
+        if candidates is not None:
+            candidates = sorted(candidates)
+        return candidates, remaining
+
+    def _build_predicates(self, filters, search_index, needles):
+        """Build one check per active filter, cheap numeric checks first
+
+        Each predicate takes a product's position and returns True if the
+        product passes. Empty filters add no predicate at all.
+        """
+        predicates = []
+
+        # Quantities and prices were parsed once when the index was built
+        quantities = search_index.quantities
+        prices = search_index.prices
+
+        stock_status = filters["stock_status"]
+        if stock_status == "in_stock":
+            predicates.append(lambda i: quantities[i] > 0)
+        elif stock_status == "out_of_stock":
+            predicates.append(lambda i: quantities[i] <= 0)
+
+        min_price = filters["min_price"]
+        if min_price is not None:
+            predicates.append(lambda i: prices[i] >= min_price)
+        max_price = filters["max_price"]
+        if max_price is not None:
+            predicates.append(lambda i: prices[i] <= max_price)
+
+        # Substring checks against the precomputed lowercase columns, with
+        # each needle lowercased once instead of once per product
+        for col, needle in needles:
+            predicates.append(
+                lambda i, column=search_index.column(col), needle=needle: needle in column[i])
+
+        return predicates
+
+    def _apply_filters_vectorized(self, all_products, filters, search_index, needles,
+                                  candidates):
+        """Return the products matching all filters, using NumPy boolean masks"""
+        arrays = search_index.arrays()
+        mask = np.ones(len(all_products), dtype=bool)
+
+        stock_status = filters["stock_status"]
+        if stock_status == "in_stock":
+            mask &= arrays['quantity'] > 0
+        elif stock_status == "out_of_stock":
+            mask &= arrays['quantity'] <= 0
+
+        if filters["min_price"] is not None:
+            mask &= arrays['price'] >= filters["min_price"]
+        if filters["max_price"] is not None:
+            mask &= arrays['price'] <= filters["max_price"]
+
+        if candidates is None:
+            positions = np.flatnonzero(mask)
+        else:
+            positions = np.array(candidates, dtype=np.intp)
+            positions = positions[mask[positions]]
+
+        # Substring checks are the costly part, so each one only runs on the
+        # rows that passed the numeric checks and the text filters before it
+        for col, needle in needles:
+            if not len(positions):
+                break
+            found = np.char.find(arrays[col][positions], needle.encode("utf-8"))
+            positions = positions[found >= 0]
+
+        return [all_products[i] for i in positions]
@@ -1,35 +1,64 @@
+from ..core.search_index import SearchIndex
+
+
 class SearchHandler:
     """Handles product search functionality"""
 
     def __init__(self, translator):
         self.translator = translator
+        self._last_query = ""
+        self._last_matches = None
+        self._last_index = None
+
+    def invalidate(self):
+        """Forget the previous search results after the product list changes"""
+        self._last_query = ""
+        self._last_matches = None
+        self._last_index = None
 
-    def search_products(self, all_products, search_text):
+    def search_products(self, all_products, search_text, search_index=None):
         """
         Search products based on search text
 
         Args:
             all_products: List of all products
             search_text: Text to search for
+            search_index: Optional SearchIndex built from all_products
 
         Returns:
             tuple: (filtered_products, message)
         """
-        search_text = search_text.lower().strip()
+        search_text = search_text.casefold().strip()
         if not search_text:
+            self.invalidate()
             return all_products, None
 
-        filtered_products = []
-        for product in all_products:
-            searchable_fields = [
-                str(product[1] or ""),  # category
-                str(product[2] or ""),  # car_name
-                str(product[3] or ""),  # model
-                str(product[4] or "")  # product_name
-            ]
-            searchable_text = " ".join(searchable_fields).lower()
-            if search_text in searchable_text:
-                filtered_products.append(product)
+        if search_index is None:
+            search_index = SearchIndex(all_products)
+
+        # Any entry matching the new query also matches every substring of
+        # it, so a query built around the previous one (typed on either end)
+        # can only match a subset of the previous results. Those results are
+        # positions in the index they came from, so only that index reuses them.
+        if (self._last_matches is not None and search_index is self._last_index
+                and self._last_query in search_text):
+            matches = self._last_matches
+        else:
+            matches = None
+
+        # Every word must appear somewhere in the product. The longest word is
+        # usually the most selective, so it runs first and each later word
+        # only rechecks the products still matching.
+        for word in sorted(search_text.split(), key=len, reverse=True):
+            if matches is None:
+                matches = search_index.find_all(word)
+            else:
+                matches = search_index.find_in(word, matches)
+
+        self._last_query = search_text
+        self._last_matches = matches
+        self._last_index = search_index
+        filtered_products = [all_products[i] for i in matches]
 
         if len(filtered_products) < len(all_products):
             message = self.translator.t('search_results').format(
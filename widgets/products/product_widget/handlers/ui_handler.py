@@ -1,21 +1,36 @@
 from PyQt5.QtWidgets import (QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
-                             QLineEdit)
+                             QLineEdit, QFrame)
 from PyQt5.QtGui import QIcon, QColor
 from PyQt5.QtCore import Qt, QSize
 
-from themes import get_color
+from themes import get_color, get_current_theme
 from widgets.products.components import StatusBar
 from widgets.products.product_table import ProductsTable
 
+# Icons decoded once and shared by every UIHandler
+_ICON_CACHE = {}
+
+
+def _icon(path):
+    """Get a cached QIcon for the given path"""
+    icon = _ICON_CACHE.get(path)
+    if icon is None:
+        icon = _ICON_CACHE[path] = QIcon(path)
+    return icon
+
 
 class UIHandler:
     """Handles the UI setup and theme for the Products Widget"""
 
+    # Stylesheets built per theme name, shared by all instances
+    _style_cache = {}
+
     def __init__(self, widget, translator):
         self.widget = widget
         self.translator = translator
 
         # UI components
+        self.button_bar = None
         self.add_btn = None
         self.select_toggle = None
         self.remove_btn = None
@@ -36,49 +51,55 @@ class UIHandler:
         main_layout.setSpacing(15)
 
         # --- Button Panel ---
-        button_layout = QHBoxLayout()
+        # Buttons live in one frame so a single stylesheet styles all of them
+        self.button_bar = QFrame()
+        self.button_bar.setObjectName("buttonBar")
+        button_layout = QHBoxLayout(self.button_bar)
+        button_layout.setContentsMargins(0, 0, 0, 0)
         button_layout.setSpacing(10)
 
         # Create buttons with icons
         self.add_btn = QPushButton(self.translator.t('add_product'))
-        self.add_btn.setIcon(QIcon("resources/add_icon.png"))
+        self.add_btn.setIcon(_icon("resources/add_icon.png"))
         self.add_btn.setIconSize(QSize(18, 18))
         self.add_btn.setCursor(Qt.PointingHandCursor)
         button_layout.addWidget(self.add_btn)
 
         self.select_toggle = QPushButton(self.translator.t('select_button'))
-        self.select_toggle.setIcon(QIcon("resources/select_icon.png"))
+        self.select_toggle.setObjectName("selectToggle")
+        self.select_toggle.setProperty("selectMode", False)
+        self.select_toggle.setIcon(_icon("resources/select_icon.png"))
         self.select_toggle.setIconSize(QSize(18, 18))
         self.select_toggle.setCheckable(True)
         self.select_toggle.setCursor(Qt.PointingHandCursor)
         button_layout.addWidget(self.select_toggle)
 
         self.remove_btn = QPushButton(self.translator.t('remove'))
-        self.remove_btn.setIcon(QIcon("resources/delete_icon.png"))
+        self.remove_btn.setIcon(_icon("resources/delete_icon.png"))
         self.remove_btn.setIconSize(QSize(18, 18))
         self.remove_btn.setCursor(Qt.PointingHandCursor)
         button_layout.addWidget(self.remove_btn)
 
         self.filter_btn = QPushButton(self.translator.t('filter_button'))
-        self.filter_btn.setIcon(QIcon("resources/filter_icon.png"))
+        self.filter_btn.setIcon(_icon("resources/filter_icon.png"))
         self.filter_btn.setIconSize(QSize(18, 18))
         self.filter_btn.setCursor(Qt.PointingHandCursor)
         button_layout.addWidget(self.filter_btn)
 
         self.export_btn = QPushButton(self.translator.t('export'))
-        self.export_btn.setIcon(QIcon("resources/export_icon.png"))
+        self.export_btn.setIcon(_icon("resources/export_icon.png"))
         self.export_btn.setIconSize(QSize(18, 18))
         self.export_btn.setCursor(Qt.PointingHandCursor)
         button_layout.addWidget(self.export_btn)
 
         self.refresh_btn = QPushButton(self.translator.t('refresh'))
-        self.refresh_btn.setIcon(QIcon("resources/refresh_icon.png"))
+        self.refresh_btn.setIcon(_icon("resources/refresh_icon.png"))
         self.refresh_btn.setIconSize(QSize(18, 18))
         self.refresh_btn.setCursor(Qt.PointingHandCursor)
 
         button_layout.addStretch()
         button_layout.addWidget(self.refresh_btn)
-        main_layout.addLayout(button_layout)
+        main_layout.addWidget(self.button_bar)
 
         # --- Search Box ---
         search_layout = QHBoxLayout()
@@ -116,6 +137,27 @@ class UIHandler:
 
     def apply_theme(self):
         """Apply theme to all UI components"""
+        styles = self._get_theme_styles()
+
+        self.widget.setStyleSheet(styles['base'])
+        self.button_bar.setStyleSheet(styles['button'])
+        self.search_input.setStyleSheet(styles['search'])
+        self.update_select_button_style(self.select_toggle.isChecked())
+
+        self.product_table.apply_theme()
+        self.status_bar.set_theme(styles['status'])
+
+    def _get_theme_styles(self):
+        """Get the stylesheets for the current theme, building them on first use"""
+        theme_name = get_current_theme()
+        styles = UIHandler._style_cache.get(theme_name)
+        if styles is None:
+            styles = self._build_theme_styles()
+            UIHandler._style_cache[theme_name] = styles
+        return styles
+
+    def _build_theme_styles(self):
+        """Build all stylesheets used by the widget from the current theme colors"""
         bg_color = get_color('background')
         text_color = get_color('text')
         card_bg = get_color('card_bg')
@@ -124,6 +166,7 @@ class UIHandler:
         button_hover = get_color('button_hover')
         button_pressed = get_color('button_pressed')
         highlight_color = get_color('highlight')
+        input_bg = get_color('input_bg')
 
         try:
             accent_color = get_color('accent')
@@ -138,6 +181,12 @@ class UIHandler:
         shadow_opacity = "0.4" if is_dark_theme else "0.15"
         shadow_color = f"rgba(0, 0, 0, {shadow_opacity})"
 
+        # Derived colors, computed once here rather than inline in each rule
+        highlight = QColor(highlight_color)
+        highlight_hover = highlight.darker(110).name()
+        highlight_hover_border = highlight.darker(120).name()
+        focus_bg = QColor(input_bg).lighter(105).name()
+
         base_style = f"""
             QWidget {{
                 color: {text_color};
@@ -151,10 +200,9 @@ class UIHandler:
                 padding: 5px;
             }}
         """
-        self.widget.setStyleSheet(base_style)
 
         btn_style = f"""
-            QPushButton {{
+            #buttonBar QPushButton {{
                 background-color: {button_color};
                 color: {text_color};
                 border: 1px solid {border_color};
@@ -165,35 +213,45 @@ class UIHandler:
                 font-weight: bold;
                 min-width: 100px;
             }}
-            QPushButton:hover {{
+            #buttonBar QPushButton:hover {{
                 background-color: {button_hover};
                 border: 1px solid {highlight_color};
                 box-shadow: 0px 2px 4px {shadow_color};
             }}
-            QPushButton:pressed {{
+            #buttonBar QPushButton:pressed {{
                 background-color: {button_pressed};
                 border: 2px solid {highlight_color};
                 padding: 9px 17px;
             }}
-            QPushButton:disabled {{
+            #buttonBar QPushButton:disabled {{
                 background-color: {card_bg};
                 color: {border_color};
                 border: 1px solid {border_color};
             }}
-            QPushButton:checked {{
+            #buttonBar QPushButton:checked {{
                 background-color: {highlight_color};
                 color: {bg_color};
                 border: 2px solid {highlight_color};
             }}
+            #buttonBar QPushButton#selectToggle:pressed,
+            #buttonBar QPushButton#selectToggle:checked {{
+                border: 1px solid {highlight_color};
+                padding: 10px 18px;
+            }}
+            #buttonBar QPushButton#selectToggle[selectMode="true"] {{
+                background-color: {highlight_color};
+                color: {bg_color};
+                border: 1px solid {highlight_color};
+            }}
+            #buttonBar QPushButton#selectToggle[selectMode="true"]:hover {{
+                background-color: {highlight_hover};
+                border-color: {highlight_hover_border};
+            }}
         """
 
-        for btn in [self.add_btn, self.select_toggle, self.remove_btn, self.filter_btn,
-                    self.export_btn, self.refresh_btn]:
-            btn.setStyleSheet(btn_style)
-
         search_style = f"""
             QLineEdit {{
-                background-color: {get_color('input_bg')};
+                background-color: {input_bg};
                 color: {text_color};
                 border: 2px solid {border_color};
                 border-radius: 6px;
@@ -202,16 +260,14 @@ class UIHandler:
             }}
             QLineEdit:focus {{
                 border: 2px solid {highlight_color};
-                background-color: {QColor(get_color('input_bg')).lighter(105).name()};
+                background-color: {focus_bg};
             }}
             QLabel {{
                 font-weight: bold;
             }}
         """
-        self.search_input.setStyleSheet(search_style)
-        self.product_table.apply_theme()
 
-        # Set up the status bar theme
+        # Status bar theme
         theme_status = {
             "success": {"bg": get_color('status_success_bg') or "#e8f5e9",
                         "border": get_color('status_success_border') or "#81c784",
@@ -226,80 +282,21 @@ class UIHandler:
                      "border": get_color('status_info_border') or "#64b5f6",
                      "text": get_color('status_info_text') or "#1565C0"}
         }
-        self.status_bar.set_theme(theme_status)
+
+        return {
+            'base': base_style,
+            'button': btn_style,
+            'search': search_style,
+            'status': theme_status
+        }
 
     def update_select_button_style(self, checked):
         """Update the style of the select button based on its state"""
-        bg_color = get_color('background')
-        text_color = get_color('text')
-        border_color = get_color('border')
-        highlight_color = get_color('highlight')
-        button_color = get_color('button')
-        button_hover = get_color('button_hover')
-        button_pressed = get_color('button_pressed')
-        card_bg = get_color('card_bg')
-
-        is_dark_theme = QColor(bg_color).lightness() < 128
-        shadow_opacity = "0.4" if is_dark_theme else "0.15"
-        shadow_color = f"rgba(0, 0, 0, {shadow_opacity})"
-
-        if checked:
-            highlight_style = f"""
-                QPushButton {{
-                    background-color: {highlight_color};
-                    color: {bg_color};
-                    border: 1px solid {highlight_color};
-                    border-radius: 6px;
-                    padding: 10px 18px;
-                    margin: 3px;
-                    font-size: 15px;
-                    font-weight: bold;
-                    min-width: 100px;
-                    box-sizing: border-box;
-                }}
-                QPushButton:hover {{
-                    background-color: {QColor(highlight_color).darker(110).name()};
-                    border-color: {QColor(highlight_color).darker(120).name()};
-                }}
-            """
-            self.select_toggle.setStyleSheet(highlight_style)
-        else:
-            btn_style = f"""
-                QPushButton {{
-                    background-color: {button_color};
-                    color: {text_color};
-                    border: 1px solid {border_color};
-                    border-radius: 6px;
-                    padding: 10px 18px;
-                    margin: 3px;
-                    font-size: 15px;
-                    font-weight: bold;
-                    min-width: 100px;
-                    box-sizing: border-box;
-                }}
-                QPushButton:hover {{
-                    background-color: {button_hover};
-                    border: 1px solid {highlight_color};
-                    box-shadow: 0px 2px 4px {shadow_color};
-                }}
-                QPushButton:pressed {{
-                    background-color: {button_pressed};
-                    border: 1px solid {highlight_color};
-                    padding: 10px 18px;
-                }}
-                QPushButton:disabled {{
-                    background-color: {card_bg};
-                    color: {border_color};
-                    border: 1px solid {border_color};
-                }}
-                QPushButton:checked {{
-                    background-color: {highlight_color};
-                    color: {bg_color};
-                    border: 1px solid {highlight_color};
-                    padding: 10px 18px;
-                }}
-            """
-            self.select_toggle.setStyleSheet(btn_style)
+        # The button bar stylesheet has rules for both states, just re-polish
+        self.select_toggle.setProperty("selectMode", bool(checked))
+        style = self.select_toggle.style()
+        style.unpolish(self.select_toggle)
+        style.polish(self.select_toggle)
 
     def update_translations(self):
         """Update translations for all text elements"""
@@ -1,8 +1,12 @@
 from PyQt5.QtWidgets import QDialog
-from PyQt5.QtCore import QTimer
+from PyQt5.QtCore import Qt, QTimer, QMetaObject, Q_ARG
 
+from themes import get_current_theme
 from widgets.products.dialogs.themed_meesage import ThemedMessageDialog
 from widgets.products.dialogs import AddProductDialog
+from utils.logging_config import get_logger
+
+logger = get_logger(__name__)
 
 
 class AddOperation:
@@ -15,16 +19,34 @@ class AddOperation:
         self.validator = validator
         self.status_bar = status_bar
 
+        # The add dialog is built once and reused until theme or language change
+        self._dialog = None
+        self._dialog_key = None
+
     def show_add_dialog(self):
         """Show the add product dialog"""
         try:
-            dialog = AddProductDialog(self.translator, self.parent)
-            dialog.finished.connect(lambda: self._handle_dialog_result(dialog))
+            dialog = self._get_dialog()
+            dialog.reset()
             dialog.show()
+            dialog.raise_()
+            dialog.activateWindow()
         except Exception as e:
             print(f"Dialog error: {e}")
             self.status_bar.show_message(self.translator.t('dialog_error'), "error")
 
+    def _get_dialog(self):
+        """Get the cached add dialog, rebuilding it if theme or language changed"""
+        key = (get_current_theme(), self.translator.language)
+        if self._dialog is None or self._dialog_key != key:
+            if self._dialog is not None:
+                self._dialog.deleteLater()
+            self._dialog = AddProductDialog(self.translator, self.parent)
+            self._dialog.finished.connect(
+                lambda: self._handle_dialog_result(self._dialog))
+            self._dialog_key = key
+        return self._dialog
+
     def _handle_dialog_result(self, dialog):
         """Process the result from the add product dialog"""
         if dialog.result() == QDialog.Accepted:
@@ -67,8 +89,7 @@ class AddOperation:
                     self.status_bar.show_message(success_message, "success")
 
                     # Signal to parent to reload products
-                    QTimer.singleShot(1500,
-                                      lambda: self.parent.on_product_added(existing[0]))
+                    self._notify_product_added(existing[0])
                     return existing[0]
                 else:
                     return None
@@ -92,14 +113,16 @@ class AddOperation:
                 self.status_bar.show_message(success_message, "success")
 
                 # Signal to parent to reload products
-                QTimer.singleShot(1500,
-                                  lambda: self.parent.on_product_added(verify_product[0]))
+                self._notify_product_added(verify_product[0])
                 return verify_product[0]
 
-        except Exception as e:
-            print(f"Add product error: {e}")
-            import traceback
-            print(f"Traceback: {traceback.format_exc()}")
+        except Exception:
+            logger.exception("Add product error")
             self.status_bar.show_message(self.translator.t('add_error'), "error")
             QTimer.singleShot(500, lambda: self.parent.load_products())
-            return None
\ No newline at end of file
+            return None
+
+    def _notify_product_added(self, product_id):
+        """Tell the parent widget about the product once control returns to the event loop"""
+        QMetaObject.invokeMethod(self.parent, "on_product_added", Qt.QueuedConnection,
+                                 Q_ARG(int, product_id))
@@ -1,24 +1,60 @@
-from PyQt5.QtWidgets import QProgressDialog, QApplication, QDialog
-from PyQt5.QtCore import Qt, QTimer, QEventLoop
+from PyQt5.QtWidgets import QProgressDialog, QDialog
+from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QColor
 
-from themes import get_color
+from themes import get_color, get_current_theme
+from utils.logging_config import get_logger
 from widgets.products.dialogs import DeleteConfirmationDialog
+from widgets.workers import DatabaseWorker
+
+# Below this many products the deletion finishes too quickly for a progress
+# dialog to be useful, so none is shown
+PROGRESS_DIALOG_THRESHOLD = 20
+
+# Products deleted between progress updates
+DELETE_PROGRESS_STEP = 64
+
+# Products deleted per transaction; smaller selections commit once
+DELETE_COMMIT_SIZE = 1024
+
+logger = get_logger(__name__)
+
+
+class _NullProgress:
+    """No-op stand-in for QProgressDialog used for small deletions"""
+
+    def setValue(self, value):
+        pass
+
+    def setStyleSheet(self, style):
+        pass
+
+    def close(self):
+        pass
+
+    def deleteLater(self):
+        pass
 
 
 class DeleteOperation:
     """Handles deleting products"""
 
+    # Progress dialog stylesheets built per theme name
+    _progress_style_cache = {}
+
     def __init__(self, parent_widget, translator, db, status_bar):
         self.parent = parent_widget
         self.translator = translator
         self.db = db
         self.status_bar = status_bar
+        self._delete_worker = None
+        self._progress = None
+        self._delete_count = 0
 
     def delete_selected_products(self, select_mode_enabled, product_table):
         """Delete products based on selection"""
         if not select_mode_enabled:
-            self.status_bar.show_message(
+            self.status_bar.queue_message(
                 self.translator.t('select_mode_required'),
                 "warning"
             )
@@ -26,7 +62,7 @@ class DeleteOperation:
 
         product_details = product_table.get_selected_rows_data()
         if not product_details:
-            self.status_bar.show_message(
+            self.status_bar.queue_message(
                 self.translator.t('no_rows_selected'),
                 "warning"
             )
@@ -40,88 +76,117 @@ class DeleteOperation:
         )
 
         if dialog.exec_() == QDialog.Accepted:
-            deleted_ids = self._perform_deletion(product_details)
-            if deleted_ids:
-                success_message = self.translator.t('items_deleted').format(
-                    count=len(deleted_ids))
-                self.status_bar.show_message(success_message, "success")
-
-                # Signal parent to reload products after a delay
-                QTimer.singleShot(1500,
-                                  lambda: self.parent.on_products_deleted(deleted_ids))
-            else:
-                self.status_bar.show_message(
-                    self.translator.t('delete_failed'),
-                    "error"
-                )
-
-    def _perform_deletion(self, product_list):
+            self._start_deletion(product_details)
+
+    def _start_deletion(self, product_list):
         """
-        Delete the selected products
+        Delete the selected products on a worker thread
 
         Args:
             product_list: List of (id, name) tuples of products to delete
-
-        Returns:
-            list: IDs of successfully deleted products
         """
         if not product_list:
-            return []
+            return
+
+        if self._delete_worker is not None and self._delete_worker.isRunning():
+            logger.debug("Deletion already in progress")
+            return
 
-        print(f"Starting deletion of {len(product_list)} products")
-        deleted_ids = []
+        logger.debug("Starting deletion of %d products", len(product_list))
+        self._delete_count = len(product_list)
+        self._progress = self._create_progress(len(product_list))
+
+        self._delete_worker = DatabaseWorker(
+            self.db, "delete_batch",
+            part_ids=[pid for pid, name in product_list],
+            chunk_size=DELETE_PROGRESS_STEP,
+            commit_size=DELETE_COMMIT_SIZE
+        )
+        self._delete_worker.progress.connect(self._progress.setValue)
+        self._delete_worker.finished.connect(self._on_deletion_finished)
+        self._delete_worker.error.connect(self._on_deletion_error)
+        if isinstance(self._progress, QProgressDialog):
+            self._progress.canceled.connect(self._cancel_deletion)
+        self._delete_worker.start()
+
+    def _cancel_deletion(self):
+        """Stop the deletion after the chunk currently being deleted"""
+        logger.info("Deletion canceled by user")
+        self._delete_worker.requestInterruption()
+        self.status_bar.queue_message(
+            self.translator.t('operation_canceled'),
+            "warning"
+        )
+
+    def _close_progress(self):
+        """Close and release the progress dialog of the running deletion"""
+        self._progress.setValue(self._delete_count)
+        self._progress.close()
+        self._progress.deleteLater()
+        self._progress = None
+
+    def _on_deletion_finished(self, deleted_ids):
+        """Report the result of a deletion and update the products widget"""
+        self._close_progress()
+        logger.info("Deleted %d of %d products", len(deleted_ids), self._delete_count)
+        if deleted_ids:
+            success_message = self.translator.t('items_deleted').format(
+                count=len(deleted_ids))
+            self.status_bar.queue_message(success_message, "success")
+
+            # Drop the deleted rows from the table right away
+            self.parent.on_products_deleted(deleted_ids)
+        else:
+            self.status_bar.queue_message(
+                self.translator.t('delete_failed'),
+                "error"
+            )
+
+    def _on_deletion_error(self, message):
+        """Report a deletion that failed and was rolled back"""
+        self._close_progress()
+        logger.error("Error during deletion: %s", message)
+        self.status_bar.queue_message(
+            self.translator.t('delete_error'),
+            "error"
+        )
+
+    def cleanup(self):
+        """Let a running deletion finish before the widget closes"""
+        if self._delete_worker is not None and self._delete_worker.isRunning():
+            self._delete_worker.wait()
+
+    def _create_progress(self, count):
+        """Create the progress dialog, or a no-op one for small deletions"""
+        if count < PROGRESS_DIALOG_THRESHOLD:
+            return _NullProgress()
 
-        # Create progress dialog
         progress = QProgressDialog(
-            self.translator.t('deleting_items').format(count=len(product_list)),
+            self.translator.t('deleting_items').format(count=count),
             self.translator.t('cancel'),
-            0, len(product_list), self.parent
+            0, count, self.parent
         )
         progress.setWindowModality(Qt.WindowModal)
+        progress.setAutoReset(False)
+        progress.setAutoClose(False)
         progress.setMinimumDuration(500)
         progress.setMinimumWidth(350)
 
         # Apply theme to progress dialog
         self._apply_theme_to_progress(progress)
-
-        try:
-            for i, (pid, name) in enumerate(product_list):
-                if progress.wasCanceled():
-                    print("Deletion canceled by user")
-                    self.status_bar.show_message(
-                        self.translator.t('operation_canceled'),
-                        "warning"
-                    )
-                    break
-
-                progress.setValue(i)
-                QApplication.processEvents(QEventLoop.ExcludeUserInputEvents)
-                print(f"Deleting product #{pid} - {name}")
-                success = self.db.delete_part(pid)
-
-                if success:
-                    deleted_ids.append(pid)
-                    print(f"Successfully deleted product #{pid}")
-                else:
-                    print(f"Failed to delete product #{pid}")
-
-        except Exception as e:
-            print(f"Error during deletion: {e}")
-            import traceback
-            print(traceback.format_exc())
-            self.status_bar.show_message(
-                self.translator.t('delete_error'),
-                "error"
-            )
-
-        finally:
-            progress.setValue(len(product_list))
-            progress.deleteLater()
-
-        return deleted_ids
+        return progress
 
     def _apply_theme_to_progress(self, progress):
         """Apply theme styling to progress dialog"""
+        theme_name = get_current_theme()
+        style = DeleteOperation._progress_style_cache.get(theme_name)
+        if style is None:
+            style = self._build_progress_style()
+            DeleteOperation._progress_style_cache[theme_name] = style
+        progress.setStyleSheet(style)
+
+    def _build_progress_style(self):
+        """Build the progress dialog stylesheet from the current theme colors"""
         bg_color = get_color('background')
         text_color = get_color('text')
         border_color = get_color('border')
@@ -166,4 +231,4 @@ class DeleteOperation:
                 border: 1px solid {highlight_color};
             }}
         """
-        progress.setStyleSheet(progress_style)
\ No newline at end of file
+        return progress_style
\ No newline at end of file
@@ -1,5 +1,14 @@
-from PyQt5.QtWidgets import QFileDialog
-from widgets.products.utils import export_to_csv
+from PyQt5.QtWidgets import QFileDialog, QProgressDialog
+from PyQt5.QtCore import Qt
+
+from utils.logging_config import get_logger
+from widgets.workers import ExportWorker
+
+# Rows written between progress updates; exports smaller than this show no
+# progress dialog at all
+EXPORT_PROGRESS_INTERVAL = 1000
+
+logger = get_logger(__name__)
 
 
 class ExportOperation:
@@ -9,13 +18,22 @@ class ExportOperation:
         self.parent = parent_widget
         self.translator = translator
         self.status_bar = status_bar
+        self._export_worker = None
+        self._progress = None
 
     def export_to_csv(self, product_table, all_products):
-        """Export product data to CSV file"""
+        """Export product data to a CSV file on a worker thread
+
+        Returns:
+            bool: True if the export was started
+        """
         try:
-            table = product_table.table
-            rows = table.rowCount()
-            cols = table.columnCount()
+            if self._export_worker is not None and self._export_worker.isRunning():
+                return False
+
+            model = product_table.model
+            rows = model.rowCount()
+            cols = model.columnCount()
 
             if rows == 0:
                 self.status_bar.show_message(
@@ -37,55 +55,82 @@ class ExportOperation:
             # Get headers from table
             headers = []
             for col in range(cols):
-                headers.append(table.horizontalHeaderItem(col).text())
+                headers.append(model.headerData(col, Qt.Horizontal))
 
-            # Get data from table
-            data = []
-            for row in range(rows):
-                row_data = []
-                for col in range(cols):
-                    item = table.item(row, col)
-                    row_data.append(item.text() if item else "")
-                data.append(row_data)
+            # The worker formats a snapshot of the shown products, so later
+            # table changes can't reach it; only one row's texts exist at a time
+            data = model.row_texts(model.products())
 
             # Perform export
-            success = export_to_csv(file_name, headers, data)
-
-            if success:
-                # Show success message
-                success_message = self.translator.t('export_success').format(
-                    file=file_name)
-                loaded_message = self.translator.t('products_loaded').format(
-                    count=len(all_products))
-
-                # Check for sequential messages support
-                if hasattr(self.status_bar, 'show_sequential_messages'):
-                    self.status_bar.show_sequential_messages(
-                        success_message,
-                        loaded_message,
-                        "success",
-                        "info",
-                        3000,  # Show success for 3 seconds
-                        5000  # Show loaded message for 5 seconds
-                    )
-                else:
-                    # Fall back to single message
-                    self.status_bar.show_message(success_message, "success")
-
-                return True
-            else:
-                self.status_bar.show_message(
-                    self.translator.t('export_error'),
-                    "error"
-                )
-                return False
+            self._progress = self._create_progress(rows)
+            self._export_worker = ExportWorker(
+                file_name, headers, data,
+                progress_interval=EXPORT_PROGRESS_INTERVAL
+            )
+            if self._progress is not None:
+                self._export_worker.progress.connect(self._progress.setValue)
+            self._export_worker.finished.connect(
+                lambda success: self._on_export_finished(success, file_name,
+                                                         len(all_products)))
+            self._export_worker.start()
+            return True
 
-        except Exception as e:
-            print(f"Export error: {e}")
-            import traceback
-            print(traceback.format_exc())
+        except Exception:
+            logger.exception("Export error")
             self.status_bar.show_message(
                 self.translator.t('export_error'),
                 "error"
             )
-            return False
\ No newline at end of file
+            return False
+
+    def _on_export_finished(self, success, file_name, product_count):
+        """Report the result of an export once the worker is done"""
+        if self._progress is not None:
+            self._progress.close()
+            self._progress.deleteLater()
+            self._progress = None
+
+        if success:
+            # Show success message
+            success_message = self.translator.t('export_success').format(
+                file=file_name)
+            loaded_message = self.translator.t('products_loaded').format(
+                count=product_count)
+
+            # Check for sequential messages support
+            if hasattr(self.status_bar, 'show_sequential_messages'):
+                self.status_bar.show_sequential_messages(
+                    success_message,
+                    loaded_message,
+                    "success",
+                    "info",
+                    3000,  # Show success for 3 seconds
+                    5000  # Show loaded message for 5 seconds
+                )
+            else:
+                # Fall back to single message
+                self.status_bar.show_message(success_message, "success")
+        else:
+            self.status_bar.show_message(
+                self.translator.t('export_error'),
+                "error"
+            )
+
+    def cleanup(self):
+        """Let a running export finish writing before the widget closes"""
+        if self._export_worker is not None and self._export_worker.isRunning():
+            self._export_worker.wait()
+
+    def _create_progress(self, count):
+        """Create a progress dialog for large exports, or None for small ones"""
+        if count < EXPORT_PROGRESS_INTERVAL:
+            return None
+
+        progress = QProgressDialog(
+            self.translator.t('exporting_items').format(count=count),
+            None, 0, count, self.parent
+        )
+        progress.setWindowModality(Qt.WindowModal)
+        progress.setMinimumDuration(500)
+        progress.setMinimumWidth(350)
+        return progress
@@ -20,7 +20,7 @@ class PrintOperation:
         Print a table widget
 
         Args:
-            table_widget: The QTableWidget to print
+            table_widget: The QTableView (or QTableWidget) to print
         """
         try:
             # Create printer
@@ -46,21 +46,22 @@ class PrintOperation:
         html += "<h2 style='text-align:center;'>Products List</h2>"
         html += "<table border='1' cellpadding='4' width='100%'>"
 
+        model = table.model()
+
         # Add headers
         html += "<tr bgcolor='#f0f0f0'>"
-        for col in range(table.columnCount()):
-            header = table.horizontalHeaderItem(col)
-            header_text = header.text() if header else f"Column {col}"
+        for col in range(model.columnCount()):
+            header = model.headerData(col, Qt.Horizontal)
+            header_text = header if header is not None else f"Column {col}"
             html += f"<th>{header_text}</th>"
         html += "</tr>"
 
         # Add data rows
-        for row in range(table.rowCount()):
+        for row in range(model.rowCount()):
             html += "<tr>"
-            for col in range(table.columnCount()):
-                item = table.item(row, col)
-                text = item.text() if item else ""
-                html += f"<td>{text}</td>"
+            for col in range(model.columnCount()):
+                text = model.index(row, col).data()
+                html += f"<td>{text if text is not None else ''}</td>"
             html += "</tr>"
 
         html += "</table></body></html>"
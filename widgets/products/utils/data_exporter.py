@@ -1,33 +1,59 @@
 import csv
+import os
+from itertools import islice
 
+from utils.logging_config import get_logger
 
-def export_to_csv(file_path, headers, data):
+# Write buffer size; large exports reach the disk in few, big writes
+WRITE_BUFFER_SIZE = 1 << 20
+
+logger = get_logger(__name__)
+
+
+def export_to_csv(file_path, headers, data, progress_callback=None,
+                  progress_interval=1000):
     """Export data to CSV file
 
     Args:
         file_path: Path to save the CSV file
         headers: List of column headers
-        data: List of rows (each row is a list of values)
+        data: Iterable of rows (each row is a list of values), consumed
+            lazily so it can be a generator
+        progress_callback: Optional callable receiving the number of rows
+            written so far, called once every progress_interval rows
+        progress_interval: Number of rows between progress_callback calls
 
     Returns:
         bool: Success status
     """
     try:
-        # Add .csv extension if not present
-        if not file_path.endswith('.csv'):
+        # Add .csv extension if not present, accepting any case such as .CSV
+        file_path = os.fspath(file_path)
+        if not file_path.lower().endswith('.csv'):
             file_path += '.csv'
 
-        with open(file_path, 'w', newline='', encoding='utf-8') as f:
+        with open(file_path, 'w', newline='', encoding='utf-8',
+                  buffering=WRITE_BUFFER_SIZE) as f:
             writer = csv.writer(f)
 
             # Write headers
             writer.writerow(headers)
 
             # Write data
-            for row in data:
-                writer.writerow(row)
+            if progress_callback is None:
+                writer.writerows(data)
+            else:
+                rows = iter(data)
+                written = 0
+                while True:
+                    chunk = list(islice(rows, progress_interval))
+                    if not chunk:
+                        break
+                    writer.writerows(chunk)
+                    written += len(chunk)
+                    progress_callback(written)
 
         return True
-    except Exception as e:
-        print(f"Export error: {e}")
+    except Exception:
+        logger.exception("Export error")
         return False
\ No newline at end of file
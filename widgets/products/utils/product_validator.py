@@ -17,21 +17,29 @@ class ProductValidator:
             errors.append(self.translator.t('product_name_required'))
 
         # Numeric validation
+        # Sanitized data already holds an int and a float, which are checked
+        # as they are; only other values such as raw text are parsed
         if 'quantity' in data:
-            try:
-                qty = int(data['quantity'])
-                if qty < 0:
-                    errors.append(self.translator.t('quantity_positive'))
-            except ValueError:
-                errors.append(self.translator.t('quantity_invalid'))
+            qty = data['quantity']
+            if type(qty) is not int:
+                try:
+                    qty = int(qty)
+                except ValueError:
+                    errors.append(self.translator.t('quantity_invalid'))
+                    qty = 0
+            if qty < 0:
+                errors.append(self.translator.t('quantity_positive'))
 
         if 'price' in data:
-            try:
-                price = float(data['price'])
-                if price < 0:
-                    errors.append(self.translator.t('price_positive'))
-            except ValueError:
-                errors.append(self.translator.t('price_invalid'))
+            price = data['price']
+            if type(price) is not float and type(price) is not int:
+                try:
+                    price = float(price)
+                except ValueError:
+                    errors.append(self.translator.t('price_invalid'))
+                    price = 0.0
+            if price < 0:
+                errors.append(self.translator.t('price_positive'))
 
         # Return validation result
         return (len(errors) == 0, "\n".join(errors))
@@ -42,36 +50,23 @@ class ProductValidator:
         Returns:
             dict: Sanitized data
         """
-        sanitized = {}
-
-        # Set default values for missing fields
-        if 'category' not in data or not data['category']:
-            sanitized['category'] = "3"  # Default category
-        else:
-            sanitized['category'] = data['category']
-
-        if 'car_name' not in data or not data['car_name']:
-            sanitized['car_name'] = "-"
-        else:
-            sanitized['car_name'] = data['car_name']
-
-        if 'model' not in data or not data['model']:
-            sanitized['model'] = "-"
-        else:
-            sanitized['model'] = data['model']
-
-        # Product name is required
-        sanitized['product_name'] = data.get('product_name', '')
-
-        # Convert numeric values
+        # One lookup per field, building the result dict in one go
         try:
-            sanitized['quantity'] = int(data.get('quantity', 0))
+            quantity = int(data.get('quantity', 0))
         except ValueError:
-            sanitized['quantity'] = 0
+            quantity = 0
 
         try:
-            sanitized['price'] = float(data.get('price', 0.0))
+            price = float(data.get('price', 0.0))
         except ValueError:
-            sanitized['price'] = 0.0
-
-        return sanitized
\ No newline at end of file
+            price = 0.0
+
+        return {
+            # Missing or empty text fields get their defaults
+            'category': data.get('category') or "3",  # Default category
+            'car_name': data.get('car_name') or "-",
+            'model': data.get('model') or "-",
+            'product_name': data.get('product_name', ''),  # Required, checked later
+            'quantity': quantity,
+            'price': price
+        }
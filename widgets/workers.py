@@ -5,6 +5,7 @@ from database.car_parts_db import CarPartsDB
 class DatabaseWorker(QThread):
     finished = pyqtSignal(object)
     error = pyqtSignal(str)
+    progress = pyqtSignal(int)
 
     def __init__(self, db, operation, **kwargs):
         super().__init__()
@@ -24,8 +25,52 @@ class DatabaseWorker(QThread):
                 part_id = self.kwargs.get('part_id')
                 success = self.db.delete_part(part_id)
                 self.finished.emit(success)
+            elif self.operation == "delete_batch":
+                # Delete in chunks, committing per commit_size and reporting
+                # progress per chunk; requestInterruption() stops after the
+                # current chunk
+                deleted_ids = self.db.delete_parts_chunked(
+                    self.kwargs.get('part_ids'),
+                    chunk_size=self.kwargs.get('chunk_size', 1000),
+                    commit_size=self.kwargs.get('commit_size'),
+                    on_chunk=self.progress.emit,
+                    should_stop=self.isInterruptionRequested
+                )
+                self.finished.emit(deleted_ids)
+            elif self.operation == "update_batch":
+                # Apply queued cell edits in one transaction
+                updated = self.db.update_parts(self.kwargs.get('updates'))
+                self.finished.emit(updated)
             # Add other operations as needed
         except Exception as e:
             import traceback
             self.error.emit(f"Database worker error: {str(e)}")
-            print(f"Worker thread error: {traceback.format_exc()}")
\ No newline at end of file
+            print(f"Worker thread error: {traceback.format_exc()}")
+
+
+class ExportWorker(QThread):
+    """Writes rows to a CSV file off the GUI thread
+
+    The rows must not depend on Qt objects owned by the GUI thread; pass a
+    snapshot of the data rather than reading a live model.
+    """
+    finished = pyqtSignal(bool)
+    progress = pyqtSignal(int)
+
+    def __init__(self, file_path, headers, rows, progress_interval=1000):
+        super().__init__()
+        self.file_path = file_path
+        self.headers = headers
+        self.rows = rows
+        self.progress_interval = progress_interval
+
+    def run(self):
+        # Imported here: widgets.products imports this module while loading
+        from widgets.products.utils import export_to_csv
+
+        success = export_to_csv(
+            self.file_path, self.headers, self.rows,
+            progress_callback=self.progress.emit,
+            progress_interval=self.progress_interval
+        )
+        self.finished.emit(success)